@@ -1,5 +1,7 @@
 """Cyberark CCP API Client Package"""
 
+from typing import TYPE_CHECKING, Any
+
 from .client import CyberarkCCPClient, QueryFormat
 from .exceptions import (
     CyberarkCCPAccountNotFoundError,
@@ -11,7 +13,11 @@ from .exceptions import (
     CyberarkCCPValidationError,
 )
 
+if TYPE_CHECKING:
+    from .async_client import AsyncCyberarkCCPClient
+
 __all__ = [
+    "AsyncCyberarkCCPClient",
     "CyberarkCCPClient",
     "QueryFormat",
     "CyberarkCCPError",
@@ -24,3 +30,12 @@ __all__ = [
 ]
 
 __version__ = "0.0.1"
+
+
+def __getattr__(name: str) -> Any:
+    # The async client pulls in asyncio; only import it when it is actually used
+    if name == "AsyncCyberarkCCPClient":
+        from .async_client import AsyncCyberarkCCPClient
+
+        return AsyncCyberarkCCPClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,54 @@
+"""Transport adapter that applies a shared SSL context to every connection pool.
+
+Imported by the client only when a session is created, since it loads requests.
+"""
+
+import ssl
+from typing import Any, List, Optional
+
+from requests import PreparedRequest
+from requests.adapters import DEFAULT_POOLBLOCK, HTTPAdapter
+from urllib3.poolmanager import ProxyManager
+
+
+class SSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter that hands one SSL context to the direct and the proxied pool managers.
+
+    Setting ``ssl_context`` on ``adapter.poolmanager`` alone only covers direct connections:
+    requests builds a separate manager per proxy (e.g. from ``HTTPS_PROXY``), which would then
+    connect without the client certificate or custom CA.
+    """
+
+    __attrs__: List[str] = HTTPAdapter.__attrs__ + ["ssl_context"]
+
+    def __init__(self, ssl_context: Optional[ssl.SSLContext] = None, **kwargs: Any) -> None:
+        # Set before HTTPAdapter.__init__, which builds the pool manager
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = DEFAULT_POOLBLOCK, **pool_kwargs: Any
+    ) -> None:
+        if self.ssl_context is not None:
+            pool_kwargs["ssl_context"] = self.ssl_context
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def build_connection_pool_key_attributes(self, request: PreparedRequest, verify: Any, cert: Any = None) -> Any:
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        if self.ssl_context is not None:
+            # The shared context already holds its trust store. A CA path here (e.g. from REQUESTS_CA_BUNDLE)
+            # would make urllib3 load it into the caller's context on every new connection, re-reading the
+            # bundle and widening trust beyond the caller's CA.
+            pool_kwargs.pop("ca_certs", None)
+            pool_kwargs.pop("ca_cert_dir", None)
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn: Any, url: str, verify: Any, cert: Any) -> None:
+        # Likewise, requests would otherwise set conn.ca_certs to its default CA bundle
+        if self.ssl_context is None:
+            super().cert_verify(conn, url, verify, cert)
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> ProxyManager:
+        if self.ssl_context is not None:
+            proxy_kwargs["ssl_context"] = self.ssl_context
+        return super().proxy_manager_for(proxy, **proxy_kwargs)  # type: ignore[no-any-return]
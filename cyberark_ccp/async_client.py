@@ -0,0 +1,208 @@
+"""Asynchronous CyberArk Central Credential Provider (CCP) REST API client."""
+
+import asyncio
+import ssl
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from .client import QueryFormat, _CCPClientBase
+from .exceptions import CyberarkCCPConnectionError, CyberarkCCPError, CyberarkCCPTimeoutError
+
+# aiohttp is optional and imported only once an async client is created
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class AsyncCyberarkCCPClient(_CCPClientBase):
+    """Asyncio CyberArk CCP API Client built on aiohttp.
+
+    Accepts the same parameters and raises the same exceptions as CyberarkCCPClient, so many
+    credentials can be retrieved concurrently on one event loop with ``asyncio.gather``.
+    Requires the optional ``aiohttp`` dependency (``pip install cyberark-ccp[async]``).
+    """
+
+    __slots__ = ("pool_maxsize", "_session")
+
+    def __init__(
+        self,
+        base_url: str,
+        app_id: str,
+        cert_path: Optional[str] = None,
+        verify: bool = True,
+        timeout: int = 30,
+        pool_maxsize: int = 32,
+    ) -> None:
+        """Initialize the asynchronous CyberArk CCP client.
+
+        Args:
+            base_url: Base URL of the CCP web service (e.g., 'https://ccp.example.com')
+            app_id: Application ID registered in CyberArk for authentication
+            cert_path: Path to client certificate file for certificate-based authentication
+            verify: Whether to verify SSL certificates (default: True)
+            timeout: Request timeout in seconds (default: 30)
+            pool_maxsize: Maximum number of concurrent connections to the CCP host (default: 32)
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:  # pragma: no cover - exercised only without the optional dependency
+            raise ImportError("AsyncCyberarkCCPClient requires aiohttp: pip install cyberark-ccp[async]") from None
+        super().__init__(base_url, app_id, cert_path=cert_path, verify=verify, timeout=timeout)
+        self.pool_maxsize = pool_maxsize
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the HTTP session, creating it on first use inside the running event loop."""
+        import aiohttp
+
+        if self._session is None:
+            if self.verify:
+                ssl_context = ssl.create_default_context(cafile=self.verify if isinstance(self.verify, str) else None)
+            else:
+                ssl_context = ssl.create_default_context()
+                ssl_context.check_hostname = False
+                ssl_context.verify_mode = ssl.CERT_NONE
+            # The client certificate is sent even without server verification, like the sync client
+            if self.cert_path:
+                ssl_context.load_cert_chain(self.cert_path)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_maxsize, ssl=ssl_context),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"Accept": "application/json", "Accept-Encoding": "identity"},
+            )
+        return self._session
+
+    async def get_password(
+        self,
+        account: Optional[str] = None,
+        safe: Optional[str] = None,
+        folder: Optional[str] = None,
+        password_object: Optional[str] = None,
+        username: Optional[str] = None,
+        address: Optional[str] = None,
+        database: Optional[str] = None,
+        policy_id: Optional[str] = None,
+        reason: Optional[str] = None,
+        query: Optional[str] = None,
+        query_format: Optional[QueryFormat] = None,
+        connection_timeout: Optional[int] = None,
+        fail_request_on_password_change: Optional[bool] = None,
+    ) -> str:
+        """Retrieve a password from CyberArk CCP.
+
+        See CyberarkCCPClient.get_password for parameter descriptions.
+
+        Returns:
+            The password content as a string
+
+        Raises:
+            CyberarkCCPError: If the API request fails or returns an error
+            CyberarkCCPValidationError: If parameters are invalid
+        """
+        self._validate_search_criteria(query, account, safe, password_object, username, address, database, policy_id)
+
+        params = self._build_params(
+            account=account,
+            safe=safe,
+            folder=folder,
+            password_object=password_object,
+            username=username,
+            address=address,
+            database=database,
+            policy_id=policy_id,
+            reason=reason,
+            query=query,
+            query_format=query_format,
+            connection_timeout=connection_timeout,
+            fail_request_on_password_change=fail_request_on_password_change,
+        )
+
+        return self._parse_content(await self._fetch(params))
+
+    async def get_account(
+        self,
+        account: Optional[str] = None,
+        safe: Optional[str] = None,
+        folder: Optional[str] = None,
+        password_object: Optional[str] = None,
+        username: Optional[str] = None,
+        address: Optional[str] = None,
+        database: Optional[str] = None,
+        policy_id: Optional[str] = None,
+        reason: Optional[str] = None,
+        query: Optional[str] = None,
+        query_format: Optional[QueryFormat] = None,
+        connection_timeout: Optional[int] = None,
+        fail_request_on_password_change: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve complete account information from CyberArk CCP.
+
+        See CyberarkCCPClient.get_account for parameter descriptions.
+
+        Returns:
+            Dictionary containing account information (Content, UserName, Address, Database,
+            PasswordChangeInProcess)
+
+        Raises:
+            CyberarkCCPError: If the API request fails or returns an error
+            CyberarkCCPValidationError: If parameters are invalid
+        """
+        self._validate_search_criteria(query, account, safe, password_object, username, address, database, policy_id)
+
+        params = self._build_params(
+            account=account,
+            safe=safe,
+            folder=folder,
+            password_object=password_object,
+            username=username,
+            address=address,
+            database=database,
+            policy_id=policy_id,
+            reason=reason,
+            query=query,
+            query_format=query_format,
+            connection_timeout=connection_timeout,
+            fail_request_on_password_change=fail_request_on_password_change,
+        )
+
+        return self._parse_account(await self._fetch(params))
+
+    async def _fetch(self, params: Dict[str, str]) -> bytes:
+        """Send the Accounts request and return the raw response body.
+
+        Raises:
+            CyberarkCCPError: If the API request fails or returns an error
+        """
+        import aiohttp
+
+        try:
+            async with self._get_session().get(self._accounts_url, params=params) as response:
+                status_code = response.status
+                body = await response.read()
+        except asyncio.TimeoutError:
+            raise CyberarkCCPTimeoutError(f"Request timed out after {self.timeout} seconds") from None
+        except aiohttp.ClientConnectionError as conn_err:
+            raise CyberarkCCPConnectionError(f"Connection error: {str(conn_err)}") from conn_err
+        except aiohttp.ClientError as req_err:
+            raise CyberarkCCPError(f"Request failed: {str(req_err)}") from req_err
+
+        if status_code >= 400:
+            self._raise_error_body(status_code, body, None)
+        return body
+
+    async def close(self) -> None:
+        """Close the HTTP session to free up resources."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncCyberarkCCPClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self, exc_type: Optional[type], exc_val: Optional[BaseException], exc_tb: Optional[Any]
+    ) -> None:
+        """Async context manager exit."""
+        await self.close()
@@ -1,9 +1,12 @@
 """CyberArk Central Credential Provider (CCP) REST API client."""
 
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Dict, Optional
-
-import requests
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 from .exceptions import (
     CyberarkCCPAccountNotFoundError,
@@ -15,21 +18,362 @@ from .exceptions import (
     CyberarkCCPValidationError,
 )
 
+_json_loads: Callable[[bytes], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads = json.loads
+
+# requests (and urllib3) are imported on first use so importing the package stays cheap
+if TYPE_CHECKING:
+    import ssl
+
+    import requests
 
-class QueryFormat(Enum):
-    """Query format options for CCP API."""
+
+class QueryFormat(str, Enum):
+    """Query format options for CCP API.
+
+    Members are strings, so they are sent as-is without a ``.value`` lookup.
+    """
 
     EXACT = "Exact"
     REGEXP = "Regexp"
 
+    def __str__(self) -> str:
+        return self.value
+
+
+# Precomputed wire values for boolean parameters
+_BOOL_VALUES = {True: "true", False: "false"}
+
+# CCP error codes per official specification, keyed by (HTTP status, ErrorCode)
+_API_ERRORS: Dict[Tuple[int, str], Tuple[Type[CyberarkCCPError], str]] = {
+    (400, "AIMWS030E"): (CyberarkCCPValidationError, "Invalid query format"),
+    (400, "APPAP227E"): (CyberarkCCPAccountNotFoundError, "Too many objects"),
+    (400, "APPAP228E"): (CyberarkCCPAccountNotFoundError, "Too many objects"),
+    (400, "APPAP229E"): (CyberarkCCPAccountNotFoundError, "Too many objects"),
+    (400, "APPAP007E"): (CyberarkCCPConnectionError, "Connection to Vault failed"),
+    (400, "APPAP081E"): (CyberarkCCPValidationError, "Request validation error"),
+    (400, "CASVL010E"): (CyberarkCCPValidationError, "Request validation error"),
+    (400, "AIMWS031E"): (CyberarkCCPValidationError, "Request validation error"),
+    (403, "APPAP306E"): (CyberarkCCPAuthenticationError, "Authentication failed"),
+    (403, "APPAP008E"): (CyberarkCCPAuthorizationError, "User not defined"),
+    (404, "APPAP004E"): (CyberarkCCPAccountNotFoundError, "Safe not found"),
+    (500, "APPAP282E"): (CyberarkCCPError, "Password change in progress"),
+}
+
+# Fallbacks for JSON error bodies with an unrecognised ErrorCode
+_API_STATUS_ERRORS: Dict[int, Tuple[Type[CyberarkCCPError], str]] = {
+    400: (CyberarkCCPError, "Bad Request"),
+    403: (CyberarkCCPAuthorizationError, "Authorization failed"),
+    404: (CyberarkCCPAccountNotFoundError, "Resource not found"),
+    500: (CyberarkCCPError, "Internal server error"),
+}
+
+# Classification of error responses without a JSON body
+_HTTP_STATUS_ERRORS: Dict[int, Tuple[Type[CyberarkCCPError], str]] = {
+    400: (CyberarkCCPValidationError, "Bad Request"),
+    403: (CyberarkCCPAuthenticationError, "Forbidden"),
+    404: (CyberarkCCPAccountNotFoundError, "Not Found"),
+    500: (CyberarkCCPError, "Internal Server Error"),
+}
+
+# Characters not supported in URL values by the CCP API (per specification), plus spaces
+_INVALID_URL_CHARS = ["+", "&", "%", ";"]
+_INVALID_URL_VALUE_RE = re.compile(r"[+&%; ]")
+
+# API names of the standard search parameters, in the order _build_params passes their values
+_SEARCH_PARAM_NAMES = ("Safe", "Folder", "Object", "UserName", "Address", "Database", "PolicyID")
+
+# An escape-free Content string in an Accounts response, read without decoding the whole body
+_CONTENT_RE = re.compile(rb'"Content"\s*:\s*"([^"\\]*)"')
+
+
+# Sessions handed out by CyberarkCCPClient.shared, keyed by (pool_maxsize, ssl_context)
+_SHARED_SESSIONS: Dict[Tuple[int, Any], "requests.Session"] = {}
+_SHARED_SESSIONS_LOCK = threading.Lock()
+
+
+def _create_session(pool_maxsize: int, ssl_context: Optional["ssl.SSLContext"]) -> "requests.Session":
+    """Create a Session with a pooled, retrying adapter mounted for both schemes."""
+    import requests
+    from urllib3.util.retry import Retry
+
+    from ._adapter import SSLContextAdapter
+
+    # Retry transient gateway errors on the idempotent GET; the last response is returned (not
+    # raised) so it still goes through the CCP error mapping. Connect and read errors are not
+    # retried and Retry-After is ignored, so a request never blocks much longer than `timeout`.
+    retry = Retry(
+        total=3,
+        connect=0,
+        read=False,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+        respect_retry_after_header=False,
+    )
+    session = requests.Session()
+    # Credential payloads are tiny JSON documents: compressing them costs more CPU than it saves.
+    # The cookie jar is left alone since load balancers in front of CCP may rely on affinity cookies.
+    session.headers.update({"Accept": "application/json", "Accept-Encoding": "identity"})
+    adapter = SSLContextAdapter(ssl_context, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _CCPClientBase:
+    """Request building, validation and error mapping shared by the sync and async clients."""
+
+    # The client's own attributes live in slots. __dict__ is kept so callers can still set extra
+    # attributes or patch methods on an instance (e.g. mock.patch.object(client, "get_password")),
+    # so every instance still carries a dict: this fixes the attribute layout, it saves no memory.
+    __slots__ = ("base_url", "_accounts_url", "app_id", "cert_path", "verify", "timeout", "__weakref__", "__dict__")
+
+    def __init__(
+        self,
+        base_url: str,
+        app_id: str,
+        cert_path: Optional[str] = None,
+        verify: bool = True,
+        timeout: int = 30,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self._accounts_url = f"{self.base_url}/AIMWebService/api/Accounts"
+        self.app_id = app_id
+        self.cert_path = cert_path
+        self.verify = verify
+        self.timeout = timeout
 
-class CyberarkCCPClient:
+    def _build_params(
+        self,
+        account: Optional[str] = None,
+        safe: Optional[str] = None,
+        folder: Optional[str] = None,
+        password_object: Optional[str] = None,
+        username: Optional[str] = None,
+        address: Optional[str] = None,
+        database: Optional[str] = None,
+        policy_id: Optional[str] = None,
+        reason: Optional[str] = None,
+        query: Optional[str] = None,
+        query_format: Optional[QueryFormat] = None,
+        connection_timeout: Optional[int] = None,
+        fail_request_on_password_change: Optional[bool] = None,
+    ) -> Dict[str, str]:
+        """Build query parameters for the API request.
+
+        Args:
+            account: Account name
+            safe: Safe name
+            folder: Folder name
+            password_object: Password object name
+            username: Username
+            address: Address/hostname
+            database: Database name
+            policy_id: Policy ID
+            reason: Reason for retrieval
+            query: Free query string
+            query_format: Query format (Exact or Regexp)
+            connection_timeout: Connection timeout in seconds
+            fail_request_on_password_change: Fail if password change in progress
+
+        Returns:
+            Dictionary of query parameters with non-None values
+
+        Raises:
+            CyberarkCCPValidationError: If parameters contain invalid characters
+        """
+        # requests encodes a dict in insertion order (no sorting), as cheaply as a list of
+        # tuples, and the dict form is what the cache key and callers index by name
+        params = {"AppID": self.app_id}
+
+        # If query is specified, other search criteria are ignored per API spec
+        if query:
+            self._validate_url_value(query, "Query")
+            params["Query"] = query
+
+            if query_format:
+                params["Query Format"] = query_format
+        else:
+            # Add standard search parameters
+            values = (safe, folder, password_object, username, address, database, policy_id)
+            for key, value in zip(_SEARCH_PARAM_NAMES, values):
+                if value is not None:
+                    self._validate_url_value(value, key)
+                    params[key] = value
+
+        # Add additional parameters
+        if reason is not None:
+            self._validate_url_value(reason, "Reason")
+            params["Reason"] = reason
+
+        if connection_timeout is not None:
+            if connection_timeout <= 0:
+                raise CyberarkCCPValidationError("Connection timeout must be positive")
+            params["Connection Timeout"] = str(connection_timeout)
+
+        if fail_request_on_password_change is not None:
+            params["FailRequestOnPasswordChange"] = _BOOL_VALUES[fail_request_on_password_change]
+
+        return params
+
+    def _validate_url_value(self, value: str, param_name: str) -> None:
+        """Validate that URL parameter values don't contain restricted characters.
+
+        Args:
+            value: Parameter value to validate
+            param_name: Name of the parameter for error messages
+
+        Raises:
+            CyberarkCCPValidationError: If value contains invalid characters
+        """
+        # Single scan for the common case of a clean value
+        if _INVALID_URL_VALUE_RE.search(value) is None:
+            return
+
+        # Check for characters not supported by CCP API (per specification)
+        for char in _INVALID_URL_CHARS:
+            if char in value:
+                raise CyberarkCCPValidationError(
+                    f"Parameter '{param_name}' contains invalid character '{char}'. "
+                    f"Characters {_INVALID_URL_CHARS} are not supported."
+                )
+
+        # Check for spaces (not allowed in URLs per specification)
+        raise CyberarkCCPValidationError(f"Parameter '{param_name}' contains spaces which are not allowed in URLs")
+
+    def _validate_search_criteria(self, *criteria: Optional[str]) -> None:
+        """Validate that the AppID is accompanied by at least one other search parameter.
+
+        Raises:
+            CyberarkCCPValidationError: If every search criterion is empty
+        """
+        if not any(criteria):
+            raise CyberarkCCPValidationError("The query must contain the AppID and at least one other parameter")
+
+    def _raise_api_error(
+        self,
+        status_code: int,
+        error_json: Optional[Dict[str, Any]],
+        error_text: str,
+        cause: Optional[BaseException],
+    ) -> None:
+        """Raise the exception matching a CCP error response.
+
+        Args:
+            status_code: HTTP status code of the response
+            error_json: Decoded JSON error body, or None if the body was not JSON
+            error_text: Raw response body, used when the body was not JSON
+            cause: Underlying transport exception to chain from, if any
+
+        Raises:
+            CyberarkCCPError: With detailed error information mapped to specific exceptions
+        """
+        if error_json is not None:
+            error_code = error_json.get("ErrorCode", "Unknown")
+            error_message = error_json.get("ErrorMessage", "No message provided")
+
+            api_error = _API_ERRORS.get((status_code, error_code)) or _API_STATUS_ERRORS.get(status_code)
+            if api_error is None:
+                raise CyberarkCCPError(f"CCP API error {status_code} ({error_code}): {error_message}") from cause
+            exception_class, prefix = api_error
+            raise exception_class(f"{prefix} ({error_code}): {error_message}") from cause
+
+        # Response is not JSON - use status code for classification
+        http_error = _HTTP_STATUS_ERRORS.get(status_code)
+        if http_error is None:
+            raise CyberarkCCPError(f"HTTP error {status_code}: {error_text}") from cause
+        exception_class, prefix = http_error
+        raise exception_class(f"{prefix} (HTTP {status_code}): {error_text}") from cause
+
+    def _raise_error_body(
+        self, status_code: int, body: bytes, cause: Optional[BaseException], fallback_text: str = ""
+    ) -> None:
+        """Decode an error response body and raise the matching exception.
+
+        Args:
+            status_code: HTTP status code of the response
+            body: Raw response body
+            cause: Underlying transport exception to chain from, if any
+            fallback_text: Text to report when the body is empty
+
+        Raises:
+            CyberarkCCPError: With detailed error information mapped to specific exceptions
+        """
+        # CCP error objects start with '{'; anything else (HTML, plain text) skips the JSON
+        # parser instead of raising and catching a decode error for every such response
+        if body.lstrip()[:1] == b"{":
+            try:
+                error_json = _json_loads(body)
+            except ValueError:
+                pass
+            else:
+                self._raise_api_error(status_code, error_json, "", cause)
+        error_text = body.decode("utf-8", errors="replace")
+        self._raise_api_error(status_code, None, error_text or fallback_text, cause)
+
+    @staticmethod
+    def _parse_account(body: bytes) -> Dict[str, Any]:
+        """Decode an Accounts response body.
+
+        Raises:
+            CyberarkCCPError: If the body is not valid JSON
+        """
+        try:
+            return _json_loads(body)  # type: ignore[no-any-return]
+        except ValueError as json_err:
+            raise CyberarkCCPError("Invalid JSON response from server") from json_err
+
+    @classmethod
+    def _parse_content(cls, body: bytes) -> str:
+        """Return the Content field of an Accounts response body.
+
+        A plain top-level Content string is sliced straight out of the body. Escaped or non-string
+        values, bodies where the match might not be the top-level key, and undecodable bytes fall
+        back to decoding the whole document, so both paths agree.
+
+        Raises:
+            CyberarkCCPError: If the body is not valid JSON
+        """
+        match = _CONTENT_RE.search(body)
+        if match is not None:
+            prefix = body[: match.start()]
+            # Sole "Content" key, preceded only by the top-level object's opening brace
+            if (
+                body.count(b'"Content"') == 1
+                and prefix.lstrip()[:1] == b"{"
+                and prefix.count(b"{") == 1
+                and b"[" not in prefix
+            ):
+                try:
+                    return match.group(1).decode("utf-8")
+                except UnicodeDecodeError:
+                    pass
+        return str(cls._parse_account(body).get("Content", ""))
+
+
+class CyberarkCCPClient(_CCPClientBase):
     """CyberArk CCP API Client for retrieving credentials from the Central Credential Provider.
 
     This client provides methods to interact with CyberArk's Central Credential Provider
     REST API to securely retrieve passwords and account information.
     """
 
+    __slots__ = (
+        "cache_ttl",
+        "cache_maxsize",
+        "_cache",
+        "_cache_lock",
+        "pool_maxsize",
+        "_owns_session",
+        "_session",
+        "_cert_arg",
+        "_verify_arg",
+    )
+
     def __init__(
         self,
         base_url: str,
@@ -37,6 +381,11 @@ class CyberarkCCPClient:
         cert_path: Optional[str] = None,
         verify: bool = True,
         timeout: int = 30,
+        pool_maxsize: int = 32,
+        cache_ttl: float = 0,
+        cache_maxsize: int = 256,
+        ssl_context: Optional["ssl.SSLContext"] = None,
+        session: Optional["requests.Session"] = None,
     ) -> None:
         """Initialize the CyberArk CCP client.
 
@@ -46,13 +395,63 @@ class CyberarkCCPClient:
             cert_path: Path to client certificate file for certificate-based authentication
             verify: Whether to verify SSL certificates (default: True)
             timeout: Request timeout in seconds (default: 30)
+            pool_maxsize: Maximum number of pooled connections kept open to the CCP host (default: 32).
+                Match this to the worker count when sharing the client across threads.
+            cache_ttl: Seconds to keep retrieved accounts in memory and serve repeated lookups from
+                the cache (default: 0, disabled). Cached secrets stay in process memory and cache
+                hits are not audited by the Credential Provider.
+            cache_maxsize: Maximum number of accounts kept in the cache (default: 256). The least recently
+                used entry is evicted beyond this, and expired entries are dropped whenever one is stored.
+            ssl_context: Pre-built SSL context shared by every pooled connection, e.g. with the client
+                certificate already loaded via load_cert_chain. When given, it replaces verify and cert_path
+                for TLS so the certificate and CA bundle are not re-read on each new connection.
+            session: Existing requests Session to send requests through instead of creating one. The
+                client does not close a session it was given; pool_maxsize and ssl_context are then
+                only applied by whoever configured that session.
         """
-        self.base_url = base_url.rstrip("/")
-        self.app_id = app_id
-        self.cert_path = cert_path
-        self.verify = verify
-        self.timeout = timeout
-        self._session = requests.Session()
+        super().__init__(base_url, app_id, cert_path=cert_path, verify=verify, timeout=timeout)
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        # Ordered from least to most recently used
+        self._cache: "OrderedDict[Tuple[Tuple[str, str], ...], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.pool_maxsize = pool_maxsize
+        self._owns_session = session is None
+        self._session = _create_session(pool_maxsize, ssl_context) if session is None else session
+        # Per-request TLS arguments are resolved once so the request call site stays branch-free
+        self._cert_arg: Optional[str] = cert_path or None
+        self._verify_arg: bool = verify
+        if ssl_context is not None:
+            import ssl
+
+            # urllib3 applies cert_reqs to the context, so keep it consistent with the context's own mode
+            self._verify_arg = ssl_context.verify_mode != ssl.CERT_NONE
+            self._cert_arg = None
+
+    @classmethod
+    def shared(cls, base_url: str, app_id: str, **kwargs: Any) -> "CyberarkCCPClient":
+        """Create a client that reuses a process-wide session instead of opening its own.
+
+        Clients created this way share pooled connections and TLS sessions, so short-lived clients
+        (one per function or per request) don't each pay for new TLS handshakes. Sessions are keyed by
+        the options that shape the connection pool (pool_maxsize and ssl_context); the per-request
+        settings such as base_url, cert_path and verify may differ between clients sharing a session.
+        Closing a shared client leaves the session open for the others.
+
+        Args:
+            base_url: Base URL of the CCP web service
+            app_id: Application ID registered in CyberArk for authentication
+            **kwargs: Any other CyberarkCCPClient option except session
+
+        Returns:
+            A CyberarkCCPClient using the shared session
+        """
+        key = (kwargs.get("pool_maxsize", 32), kwargs.get("ssl_context"))
+        with _SHARED_SESSIONS_LOCK:
+            session = _SHARED_SESSIONS.get(key)
+            if session is None:
+                session = _SHARED_SESSIONS[key] = _create_session(*key)
+        return cls(base_url, app_id, session=session, **kwargs)
 
     def get_password(
         self,
@@ -94,7 +493,9 @@ class CyberarkCCPClient:
             CyberarkCCPError: If the API request fails or returns an error
             CyberarkCCPValidationError: If parameters are invalid
         """
-        account_data = self.get_account(
+        self._validate_search_criteria(query, account, safe, password_object, username, address, database, policy_id)
+
+        params = self._build_params(
             account=account,
             safe=safe,
             folder=folder,
@@ -109,7 +510,10 @@ class CyberarkCCPClient:
             connection_timeout=connection_timeout,
             fail_request_on_password_change=fail_request_on_password_change,
         )
-        return str(account_data.get("Content", ""))
+
+        if self.cache_ttl > 0:
+            return str(self._fetch_account(params).get("Content", ""))
+        return self._parse_content(self._fetch(params))
 
     def get_account(
         self,
@@ -156,18 +560,7 @@ class CyberarkCCPClient:
             CyberarkCCPError: If the API request fails or returns an error
             CyberarkCCPValidationError: If parameters are invalid
         """
-        # Validate that we have AppID and at least one other parameter
-        if (
-            not query
-            and not account
-            and not safe
-            and not password_object
-            and not username
-            and not address
-            and not database
-            and not policy_id
-        ):
-            raise CyberarkCCPValidationError("The query must contain the AppID and at least one other parameter")
+        self._validate_search_criteria(query, account, safe, password_object, username, address, database, policy_id)
 
         params = self._build_params(
             account=account,
@@ -185,18 +578,88 @@ class CyberarkCCPClient:
             fail_request_on_password_change=fail_request_on_password_change,
         )
 
-        url = f"{self.base_url}/AIMWebService/api/Accounts"
+        return self._fetch_account(params)
+
+    def get_passwords_batch(
+        self, queries: Iterable[Dict[str, Any]], max_workers: int = 8
+    ) -> List[Union[str, CyberarkCCPError]]:
+        """Retrieve several passwords concurrently over the pooled session.
+
+        Args:
+            queries: Keyword arguments for get_password, one dictionary per password
+            max_workers: Maximum number of concurrent requests (default: 8), capped at pool_maxsize
+                so workers never wait on, or overflow, the connection pool
+
+        Returns:
+            One entry per query, in order: the password, or the CyberarkCCPError raised for that query
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def get_password_or_error(query: Dict[str, Any]) -> Union[str, CyberarkCCPError]:
+            try:
+                return self.get_password(**query)
+            except CyberarkCCPError as err:
+                return err
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, self.pool_maxsize))) as executor:
+            return list(executor.map(get_password_or_error, queries))
+
+    def _fetch_account(self, params: Dict[str, str]) -> Dict[str, Any]:
+        """Retrieve the account for prepared query parameters, using the cache when enabled.
+
+        Args:
+            params: Query parameters built by _build_params
+
+        Returns:
+            Dictionary containing account information
+
+        Raises:
+            CyberarkCCPError: If the API request fails or returns an error
+        """
+        if self.cache_ttl > 0:
+            cache_key = self._cache_key(params)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+
+        account_data = self._parse_account(self._fetch(params))
+
+        # Don't cache a password that is about to be replaced by the CPM
+        if self.cache_ttl > 0 and not account_data.get("PasswordChangeInProcess"):
+            self._store_cached(cache_key, account_data)
+        return account_data
+
+    def _fetch(self, params: Dict[str, str]) -> bytes:
+        """Send the Accounts request and return the raw response body.
+
+        The body is used as bytes, skipping requests' charset detection and text decoding.
+        """
+        return self._request(params).content
+
+    def _request(self, params: Dict[str, str]) -> "requests.Response":
+        """Send the Accounts request and map transport and HTTP errors to CCP exceptions.
+
+        Args:
+            params: Query parameters built by _build_params
+
+        Returns:
+            The successful HTTP response
+
+        Raises:
+            CyberarkCCPError: If the API request fails or returns an error
+        """
+        import requests
 
         try:
             response = self._session.get(
-                url,
+                self._accounts_url,
                 params=params,
-                verify=self.verify,
-                cert=self.cert_path if self.cert_path else None,
+                verify=self._verify_arg,
+                cert=self._cert_arg,
                 timeout=self.timeout,
             )
             response.raise_for_status()
-            return response.json()  # type: ignore[no-any-return]
+            return response
 
         except requests.exceptions.HTTPError as http_err:
             self._handle_http_error(response, http_err)
@@ -208,115 +671,55 @@ class CyberarkCCPClient:
             raise CyberarkCCPConnectionError(f"Connection error: {str(conn_err)}") from conn_err
         except requests.exceptions.RequestException as req_err:
             raise CyberarkCCPError(f"Request failed: {str(req_err)}") from req_err
-        except ValueError as json_err:
-            raise CyberarkCCPError("Invalid JSON response from server") from json_err
 
-    def _build_params(
-        self,
-        account: Optional[str] = None,
-        safe: Optional[str] = None,
-        folder: Optional[str] = None,
-        password_object: Optional[str] = None,
-        username: Optional[str] = None,
-        address: Optional[str] = None,
-        database: Optional[str] = None,
-        policy_id: Optional[str] = None,
-        reason: Optional[str] = None,
-        query: Optional[str] = None,
-        query_format: Optional[QueryFormat] = None,
-        connection_timeout: Optional[int] = None,
-        fail_request_on_password_change: Optional[bool] = None,
-    ) -> Dict[str, str]:
-        """Build query parameters for the API request.
+    def invalidate_cache(self, **criteria: Any) -> None:
+        """Drop cached accounts.
 
         Args:
-            account: Account name
-            safe: Safe name
-            folder: Folder name
-            password_object: Password object name
-            username: Username
-            address: Address/hostname
-            database: Database name
-            policy_id: Policy ID
-            reason: Reason for retrieval
-            query: Free query string
-            query_format: Query format (Exact or Regexp)
-            connection_timeout: Connection timeout in seconds
-            fail_request_on_password_change: Fail if password change in progress
-
-        Returns:
-            Dictionary of query parameters with non-None values
-
-        Raises:
-            CyberarkCCPValidationError: If parameters contain invalid characters
+            **criteria: Search criteria as accepted by get_account. When omitted, the whole cache is cleared;
+                otherwise only the entry for those criteria is removed.
         """
-        params = {
-            "AppID": self.app_id,
-        }
-
-        # If query is specified, other search criteria are ignored per API spec
-        if query:
-            self._validate_url_value(query, "Query")
-            params["Query"] = query
-
-            if query_format:
-                params["Query Format"] = query_format.value
-        else:
-            # Add standard search parameters
-            optional_params = {
-                "Safe": safe,
-                "Folder": folder,
-                "Object": password_object,
-                "UserName": username,
-                "Address": address,
-                "Database": database,
-                "PolicyID": policy_id,
-            }
-
-            for key, value in optional_params.items():
-                if value is not None:
-                    self._validate_url_value(value, key)
-                    params[key] = value
-
-        # Add additional parameters
-        if reason is not None:
-            self._validate_url_value(reason, "Reason")
-            params["Reason"] = reason
-
-        if connection_timeout is not None:
-            if connection_timeout <= 0:
-                raise CyberarkCCPValidationError("Connection timeout must be positive")
-            params["Connection Timeout"] = str(connection_timeout)
-
-        if fail_request_on_password_change is not None:
-            params["FailRequestOnPasswordChange"] = str(fail_request_on_password_change).lower()
-
-        return params
-
-    def _validate_url_value(self, value: str, param_name: str) -> None:
-        """Validate that URL parameter values don't contain restricted characters.
-
-        Args:
-            value: Parameter value to validate
-            param_name: Name of the parameter for error messages
-
-        Raises:
-            CyberarkCCPValidationError: If value contains invalid characters
+        with self._cache_lock:
+            if criteria:
+                self._cache.pop(self._cache_key(self._build_params(**criteria)), None)
+            else:
+                self._cache.clear()
+
+    @staticmethod
+    def _cache_key(params: Dict[str, str]) -> Tuple[Tuple[str, str], ...]:
+        """Build the cache key for a request; the audit-only Reason does not identify the account."""
+        return tuple(sorted(item for item in params.items() if item[0] != "Reason"))
+
+    def _get_cached(self, cache_key: Tuple[Tuple[str, str], ...]) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached account if it has not expired, evicting it otherwise."""
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is None:
+                return None
+            stored_at, account_data = entry
+            if time.monotonic() - stored_at >= self.cache_ttl:
+                del self._cache[cache_key]
+                return None
+            self._cache.move_to_end(cache_key)
+            return dict(account_data)
+
+    def _store_cached(self, cache_key: Tuple[Tuple[str, str], ...], account_data: Dict[str, Any]) -> None:
+        """Cache a copy of an account, dropping expired entries and evicting beyond cache_maxsize.
+
+        Entries are otherwise only replaced when the same key is read again, so without this pruning a
+        process that looks up many distinct accounts would keep every secret in memory indefinitely.
         """
-        # Check for characters not supported by CCP API (per specification)
-        invalid_chars = ["+", "&", "%", ";"]
-        for char in invalid_chars:
-            if char in value:
-                raise CyberarkCCPValidationError(
-                    f"Parameter '{param_name}' contains invalid character '{char}'. "
-                    f"Characters {invalid_chars} are not supported."
-                )
-
-        # Check for spaces (not allowed in URLs per specification)
-        if " " in value:
-            raise CyberarkCCPValidationError(f"Parameter '{param_name}' contains spaces which are not allowed in URLs")
-
-    def _handle_http_error(self, response: requests.Response, http_err: requests.exceptions.HTTPError) -> None:
+        now = time.monotonic()
+        with self._cache_lock:
+            expired = [key for key, (stored_at, _) in self._cache.items() if now - stored_at >= self.cache_ttl]
+            for key in expired:
+                del self._cache[key]
+            self._cache[cache_key] = (now, dict(account_data))
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.cache_maxsize:
+                self._cache.popitem(last=False)
+
+    def _handle_http_error(self, response: "requests.Response", http_err: "requests.exceptions.HTTPError") -> None:
         """Handle HTTP errors from the CCP API according to official specification.
 
         Args:
@@ -326,85 +729,12 @@ class CyberarkCCPClient:
         Raises:
             CyberarkCCPError: With detailed error information mapped to specific exceptions
         """
-        status_code = response.status_code
-
-        try:
-            error_json = response.json()
-            error_code = error_json.get("ErrorCode", "Unknown")
-            error_message = error_json.get("ErrorMessage", "No message provided")
-
-            # Map specific CCP error codes per official specification
-            if status_code == 400:  # Bad Request
-                if error_code in ["AIMWS030E"]:
-                    raise CyberarkCCPValidationError(
-                        f"Invalid query format ({error_code}): {error_message}"
-                    ) from http_err
-                elif error_code in ["APPAP227E", "APPAP228E", "APPAP229E"]:
-                    raise CyberarkCCPAccountNotFoundError(
-                        f"Too many objects ({error_code}): {error_message}"
-                    ) from http_err
-                elif error_code in ["APPAP007E"]:
-                    raise CyberarkCCPConnectionError(
-                        f"Connection to Vault failed ({error_code}): {error_message}"
-                    ) from http_err
-                elif error_code in ["APPAP081E", "CASVL010E", "AIMWS031E"]:
-                    raise CyberarkCCPValidationError(
-                        f"Request validation error ({error_code}): {error_message}"
-                    ) from http_err
-                else:
-                    raise CyberarkCCPError(f"Bad Request ({error_code}): {error_message}") from http_err
-
-            elif status_code == 403:  # Forbidden
-                if error_code in ["APPAP306E"]:
-                    raise CyberarkCCPAuthenticationError(
-                        f"Authentication failed ({error_code}): {error_message}"
-                    ) from http_err
-                elif error_code in ["APPAP008E"]:
-                    raise CyberarkCCPAuthorizationError(
-                        f"User not defined ({error_code}): {error_message}"
-                    ) from http_err
-                else:
-                    raise CyberarkCCPAuthorizationError(
-                        f"Authorization failed ({error_code}): {error_message}"
-                    ) from http_err
-
-            elif status_code == 404:  # Not Found
-                if error_code in ["APPAP004E"]:
-                    raise CyberarkCCPAccountNotFoundError(
-                        f"Safe not found ({error_code}): {error_message}"
-                    ) from http_err
-                else:
-                    raise CyberarkCCPAccountNotFoundError(
-                        f"Resource not found ({error_code}): {error_message}"
-                    ) from http_err
-
-            elif status_code == 500:  # Internal Server Error
-                if error_code in ["APPAP282E"]:
-                    raise CyberarkCCPError(f"Password change in progress ({error_code}): {error_message}") from http_err
-                else:
-                    raise CyberarkCCPError(f"Internal server error ({error_code}): {error_message}") from http_err
-
-            else:
-                raise CyberarkCCPError(f"CCP API error {status_code} ({error_code}): {error_message}") from http_err
-
-        except ValueError:
-            # Response is not JSON - use status code for classification
-            error_text = response.text or str(http_err)
-
-            if status_code == 400:
-                raise CyberarkCCPValidationError(f"Bad Request (HTTP {status_code}): {error_text}") from http_err
-            elif status_code == 403:
-                raise CyberarkCCPAuthenticationError(f"Forbidden (HTTP {status_code}): {error_text}") from http_err
-            elif status_code == 404:
-                raise CyberarkCCPAccountNotFoundError(f"Not Found (HTTP {status_code}): {error_text}") from http_err
-            elif status_code == 500:
-                raise CyberarkCCPError(f"Internal Server Error (HTTP {status_code}): {error_text}") from http_err
-            else:
-                raise CyberarkCCPError(f"HTTP error {status_code}: {error_text}") from http_err
+        self._raise_error_body(response.status_code, response.content, http_err, str(http_err))
 
     def close(self) -> None:
-        """Close the HTTP session to free up resources."""
-        self._session.close()
+        """Close the HTTP session to free up resources, unless it was supplied by the caller or shared."""
+        if self._owns_session:
+            self._session.close()
 
     def __enter__(self) -> "CyberarkCCPClient":
         """Context manager entry."""
@@ -413,3 +743,12 @@ class CyberarkCCPClient:
     def __exit__(self, exc_type: Optional[type], exc_val: Optional[BaseException], exc_tb: Optional[Any]) -> None:
         """Context manager exit."""
         self.close()
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``cyberark_ccp.client.requests`` resolvable (e.g. as a mock.patch target) now that it is lazy
+    if name == "requests":
+        import requests
+
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
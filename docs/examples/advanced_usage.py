@@ -1,7 +1,9 @@
 """Advanced usage examples for CyberArk CCP Python client."""
 
+import asyncio
 import os
 from cyberark_ccp import (
+    AsyncCyberarkCCPClient,
     CyberarkCCPClient,
     QueryFormat,
     CyberarkCCPError,
@@ -173,21 +175,42 @@ def batch_credential_retrieval():
     
     credentials = {}
     
-    for request in credential_requests:
-        try:
-            password = client.get_password(
-                reason="Batch credential retrieval",
-                **request
-            )
+    # Requests run concurrently over the client's pooled connections
+    results = client.get_passwords_batch(
+        [dict(request, reason="Batch credential retrieval") for request in credential_requests]
+    )
+    
+    for request, result in zip(credential_requests, results):
+        if isinstance(result, CyberarkCCPError):
+            print(f"Failed to retrieve {request}: {result}")
+        else:
             key = f"{request['safe']}/{request['password_object']}"
-            credentials[key] = password
+            credentials[key] = result
             print(f"Retrieved: {key}")
-            
-        except CyberarkCCPError as e:
-            print(f"Failed to retrieve {request}: {e}")
     
     print(f"Successfully retrieved {len(credentials)} credentials")
 
+async def async_batch_credential_retrieval():
+    """Example: Retrieving multiple credentials concurrently with asyncio."""
+    credential_requests = [
+        {"safe": "DatabaseCredentials", "password_object": "DB1_User"},
+        {"safe": "WebServiceCredentials", "password_object": "API_Service"},
+        {"safe": "SystemCredentials", "password_object": "Admin_Account"},
+    ]
+    
+    async with AsyncCyberarkCCPClient("https://ccp.example.com", "BatchApp") as client:
+        results = await asyncio.gather(
+            *(client.get_password(reason="Batch credential retrieval", **request) for request in credential_requests),
+            return_exceptions=True
+        )
+    
+    for request, result in zip(credential_requests, results):
+        key = f"{request['safe']}/{request['password_object']}"
+        if isinstance(result, CyberarkCCPError):
+            print(f"Failed to retrieve {key}: {result}")
+        else:
+            print(f"Retrieved: {key}")
+
 def password_change_handling():
     """Example: Handling password change scenarios."""
     client = CyberarkCCPClient(
@@ -247,5 +270,8 @@ if __name__ == "__main__":
     print("\n=== Batch Credential Retrieval ===")
     batch_credential_retrieval()
     
+    print("\n=== Async Batch Credential Retrieval ===")
+    asyncio.run(async_batch_credential_retrieval())
+    
     print("\n=== Password Change Handling ===")
     password_change_handling()
\ No newline at end of file
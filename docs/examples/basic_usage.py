@@ -2,12 +2,14 @@
 
 from cyberark_ccp import CyberarkCCPClient, CyberarkCCPError
 
+# All examples talk to the same CCP host. CyberarkCCPClient.shared() hands each of them a
+# client backed by one process-wide session, so pooled connections and TLS sessions are
+# reused between examples instead of paying a new handshake per function.
+CCP_URL = "https://ccp.example.com"
+
 def basic_password_retrieval():
     """Example: Basic password retrieval."""
-    client = CyberarkCCPClient(
-        base_url="https://ccp.example.com",
-        app_id="MyApplication"
-    )
+    client = CyberarkCCPClient.shared(CCP_URL, "MyApplication")
     
     try:
         password = client.get_password(
@@ -22,10 +24,7 @@ def basic_password_retrieval():
 
 def get_complete_account_info():
     """Example: Get complete account information."""
-    client = CyberarkCCPClient(
-        base_url="https://ccp.example.com",
-        app_id="MyApplication"
-    )
+    client = CyberarkCCPClient.shared(CCP_URL, "MyApplication")
     
     try:
         account_info = client.get_account(
@@ -45,7 +44,8 @@ def get_complete_account_info():
 
 def using_context_manager():
     """Example: Using client as context manager."""
-    with CyberarkCCPClient("https://ccp.example.com", "MyApp") as client:
+    # Leaving the block closes the client; the shared session stays open for the other examples
+    with CyberarkCCPClient.shared(CCP_URL, "MyApp") as client:
         password = client.get_password(
             safe="TestSafe",
             password_object="TestAccount",
@@ -56,10 +56,7 @@ def using_context_manager():
 
 def multiple_search_criteria():
     """Example: Using multiple search criteria."""
-    client = CyberarkCCPClient(
-        base_url="https://ccp.example.com",
-        app_id="DatabaseApp"
-    )
+    client = CyberarkCCPClient.shared(CCP_URL, "DatabaseApp")
     
     try:
         account_info = client.get_account(
@@ -78,9 +75,9 @@ def multiple_search_criteria():
 
 def with_connection_timeout():
     """Example: Using custom connection timeout."""
-    client = CyberarkCCPClient(
-        base_url="https://ccp.example.com",
-        app_id="MyApp",
+    client = CyberarkCCPClient.shared(
+        CCP_URL,
+        "MyApp",
         timeout=60  # 60 second timeout
     )
     
@@ -0,0 +1,34 @@
+"""CCP error code table shared by the test modules and the api_error_codes fixture."""
+
+from types import MappingProxyType
+
+from cyberark_ccp import (
+    CyberarkCCPAccountNotFoundError,
+    CyberarkCCPAuthenticationError,
+    CyberarkCCPAuthorizationError,
+    CyberarkCCPConnectionError,
+    CyberarkCCPError,
+    CyberarkCCPValidationError,
+)
+
+# Expected exception type for each CCP error code; read-only since every test shares it
+API_ERROR_CODES = MappingProxyType(
+    {
+        # 400 Bad Request errors
+        "AIMWS030E": CyberarkCCPValidationError,
+        "APPAP227E": CyberarkCCPAccountNotFoundError,
+        "APPAP228E": CyberarkCCPAccountNotFoundError,
+        "APPAP229E": CyberarkCCPAccountNotFoundError,
+        "APPAP007E": CyberarkCCPConnectionError,
+        "APPAP081E": CyberarkCCPValidationError,
+        "CASVL010E": CyberarkCCPValidationError,
+        "AIMWS031E": CyberarkCCPValidationError,
+        # 403 Forbidden errors
+        "APPAP306E": CyberarkCCPAuthenticationError,
+        "APPAP008E": CyberarkCCPAuthorizationError,
+        # 404 Not Found errors
+        "APPAP004E": CyberarkCCPAccountNotFoundError,
+        # 500 Internal Server Error
+        "APPAP282E": CyberarkCCPError,
+    }
+)
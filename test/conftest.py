@@ -1,55 +1,157 @@
 """Pytest configuration and fixtures for CyberArk CCP API client tests."""
 
+import ipaddress
+import json
+import socket
+from dataclasses import dataclass
 from unittest.mock import Mock
 
 import pytest
 import requests
+from requests.exceptions import HTTPError
 
 from cyberark_ccp import CyberarkCCPClient
 
-
-@pytest.fixture
+from ._error_codes import API_ERROR_CODES
+
+# Fixture clients are stateless between calls (no cache), so one per run is enough. A larger
+# pool keeps connections from being evicted when tests run concurrently (e.g. pytest-xdist).
+FIXTURE_POOL_MAXSIZE = 128
+
+
+def _is_loopback(host):
+    """Return whether a host or socket address stays on this machine."""
+    if isinstance(host, tuple):
+        host = host[0]
+    if not isinstance(host, str):
+        # AF_UNIX paths (bytes) and None (passive lookups) never leave the machine
+        return True
+    if host in ("", "localhost"):
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _block_network():
+    """Fail loudly if any test opens a real connection instead of going through a mock.
+
+    Loopback traffic is let through: asyncio's event loop uses a loopback socketpair on Windows,
+    and some tests run a local server to exercise the real transport adapter.
+    """
+    real_getaddrinfo = socket.getaddrinfo
+    real_connect = socket.socket.connect
+    real_connect_ex = socket.socket.connect_ex
+
+    def blocked():
+        return RuntimeError("Network access is blocked in tests; mock the request instead")
+
+    def guarded_getaddrinfo(host, *args, **kwargs):
+        if not _is_loopback(host):
+            raise blocked()
+        return real_getaddrinfo(host, *args, **kwargs)
+
+    def guarded_connect(sock, address):
+        if not _is_loopback(address):
+            raise blocked()
+        return real_connect(sock, address)
+
+    def guarded_connect_ex(sock, address):
+        if not _is_loopback(address):
+            raise blocked()
+        return real_connect_ex(sock, address)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(socket, "getaddrinfo", guarded_getaddrinfo)
+        mp.setattr(socket.socket, "connect", guarded_connect)
+        mp.setattr(socket.socket, "connect_ex", guarded_connect_ex)
+        yield
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a basic CyberArk CCP client for testing."""
-    return CyberarkCCPClient(base_url="https://test.example.com", app_id="TestApplication", verify=True, timeout=30)
+    """Create a basic CyberArk CCP client for testing, shared by every test module."""
+    client = CyberarkCCPClient(
+        base_url="https://test.com",
+        app_id="TestApp",
+        verify=True,
+        timeout=30,
+        pool_maxsize=FIXTURE_POOL_MAXSIZE,
+    )
+    yield client
+    client.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def secure_client():
     """Create a CyberArk CCP client with certificate authentication for testing."""
-    return CyberarkCCPClient(
+    client = CyberarkCCPClient(
         base_url="https://secure.example.com",
         app_id="SecureApplication",
         cert_path="/path/to/test-cert.p12",
         verify=True,
         timeout=60,
+        pool_maxsize=FIXTURE_POOL_MAXSIZE,
     )
+    yield client
+    client.close()
+
+
+@dataclass(frozen=True)
+class FakeResponse:
+    """Stand-in for requests.Response exposing only what the client reads.
+
+    Much cheaper to build than a Mock, and frozen so a single instance can be shared between tests.
+    """
+
+    status_code: int = 200
+    content: bytes = b""
+
+    @classmethod
+    def from_json(cls, payload, status_code=200):
+        """Create a response whose body is the JSON encoding of payload."""
+        return cls(status_code, json.dumps(payload).encode())
+
+    def raise_for_status(self):
+        """Raise HTTPError for 4xx and 5xx responses, like requests.Response."""
+        if self.status_code >= 400:
+            raise HTTPError(f"{self.status_code} Error")
 
 
 @pytest.fixture
-def mock_successful_response():
-    """Create a mock successful API response."""
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
+def mock_get(monkeypatch):
+    """Replace requests.Session.get with a Mock for the duration of a test."""
+    mock = Mock()
+    monkeypatch.setattr(requests.Session, "get", mock)
+    return mock
+
+
+# Read-only payloads and responses are built once at import; fixtures hand out the same objects.
+# Tests that need to modify a dict must copy it first.
+_SUCCESSFUL_RESPONSE = FakeResponse.from_json(
+    {
         "Content": "test-password-123",
         "UserName": "test-user",
         "Address": "test.example.com",
         "Database": "test-database",
         "PasswordChangeInProcess": False,
     }
-    mock_response.raise_for_status.return_value = None
-    return mock_response
+)
+_MINIMAL_RESPONSE = FakeResponse.from_json({"Content": "simple-password"})
+
+
+@pytest.fixture
+def mock_successful_response():
+    """Create a mock successful API response."""
+    return _SUCCESSFUL_RESPONSE
 
 
 @pytest.fixture
 def mock_minimal_response():
     """Create a mock minimal API response with only Content."""
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"Content": "simple-password"}
-    mock_response.raise_for_status.return_value = None
-    return mock_response
+    return _MINIMAL_RESPONSE
 
 
 @pytest.fixture
@@ -57,106 +159,92 @@ def mock_error_response():
     """Create a mock error response with configurable error details."""
 
     def _create_error_response(status_code, error_code=None, error_message="Test error"):
-        mock_response = Mock()
-        mock_response.status_code = status_code
-
         if error_code:
-            mock_response.json.return_value = {"ErrorCode": error_code, "ErrorMessage": error_message}
-        else:
-            mock_response.json.side_effect = ValueError("Not JSON")
-            mock_response.text = f"HTTP {status_code} Error: {error_message}"
-
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-        return mock_response
+            return FakeResponse.from_json({"ErrorCode": error_code, "ErrorMessage": error_message}, status_code)
+        return FakeResponse(status_code, f"HTTP {status_code} Error: {error_message}".encode())
 
     return _create_error_response
 
 
-@pytest.fixture
+_SAMPLE_API_PARAMETERS = {
+    "safe": "TestSafe",
+    "folder": "TestFolder",
+    "password_object": "TestObject",
+    "username": "test-user",
+    "address": "test.example.com",
+    "database": "test-db",
+    "policy_id": "test-policy",
+    "reason": "Unit testing",
+    "connection_timeout": 60,
+    "fail_request_on_password_change": True,
+}
+
+
+@pytest.fixture(scope="session")
 def sample_api_parameters():
     """Provide sample API parameters for testing."""
-    return {
-        "safe": "TestSafe",
-        "folder": "TestFolder",
-        "password_object": "TestObject",
-        "username": "test-user",
-        "address": "test.example.com",
-        "database": "test-db",
-        "policy_id": "test-policy",
-        "reason": "Unit testing",
-        "connection_timeout": 60,
-        "fail_request_on_password_change": True,
-    }
+    return _SAMPLE_API_PARAMETERS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_characters():
     """Provide list of invalid characters for testing validation."""
     return ["+", "&", "%", ";"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_error_codes():
     """Provide mapping of API error codes to expected exception types."""
-    from cyberark_ccp import (
-        CyberarkCCPAccountNotFoundError,
-        CyberarkCCPAuthenticationError,
-        CyberarkCCPAuthorizationError,
-        CyberarkCCPConnectionError,
-        CyberarkCCPError,
-        CyberarkCCPValidationError,
-    )
+    return API_ERROR_CODES
 
-    return {
-        # 400 Bad Request errors
-        "AIMWS030E": CyberarkCCPValidationError,
-        "APPAP227E": CyberarkCCPAccountNotFoundError,
-        "APPAP228E": CyberarkCCPAccountNotFoundError,
-        "APPAP229E": CyberarkCCPAccountNotFoundError,
-        "APPAP007E": CyberarkCCPConnectionError,
-        "APPAP081E": CyberarkCCPValidationError,
-        "CASVL010E": CyberarkCCPValidationError,
-        "AIMWS031E": CyberarkCCPValidationError,
-        # 403 Forbidden errors
-        "APPAP306E": CyberarkCCPAuthenticationError,
-        "APPAP008E": CyberarkCCPAuthorizationError,
-        # 404 Not Found errors
-        "APPAP004E": CyberarkCCPAccountNotFoundError,
-        # 500 Internal Server Error
-        "APPAP282E": CyberarkCCPError,
-    }
 
+_API_SPECIFICATION_EXAMPLES = {
+    "valid_response": {
+        "Content": "MyPassword123!",
+        "UserName": "service_account",
+        "Address": "database.example.com",
+        "Database": "production_db",
+        "PasswordChangeInProcess": False,
+    },
+    "minimal_response": {"Content": "SimplePassword"},
+    "password_change_response": {"Content": "TempPassword", "PasswordChangeInProcess": True},
+    "empty_optional_fields": {
+        "Content": "Password123",
+        "UserName": "",
+        "Address": "",
+        "Database": "",
+        "PasswordChangeInProcess": False,
+    },
+}
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def api_specification_examples():
     """Provide examples from the API specification for testing."""
-    return {
-        "valid_response": {
-            "Content": "MyPassword123!",
-            "UserName": "service_account",
-            "Address": "database.example.com",
-            "Database": "production_db",
-            "PasswordChangeInProcess": False,
-        },
-        "minimal_response": {"Content": "SimplePassword"},
-        "password_change_response": {"Content": "TempPassword", "PasswordChangeInProcess": True},
-        "empty_optional_fields": {
-            "Content": "Password123",
-            "UserName": "",
-            "Address": "",
-            "Database": "",
-            "PasswordChangeInProcess": False,
-        },
-    }
+    return _API_SPECIFICATION_EXAMPLES
 
 
-@pytest.fixture(autouse=True)
-def reset_client_state():
-    """Ensure client state is reset between tests."""
-    # This fixture runs automatically before each test
-    # Can be used to reset any global state if needed
+@pytest.fixture
+def clear_shared_sessions():
+    """Drop sessions handed out by CyberarkCCPClient.shared after a test that creates them."""
     yield
-    # Cleanup after test if needed
+    from cyberark_ccp import client
+
+    for session in client._SHARED_SESSIONS.values():
+        session.close()
+    client._SHARED_SESSIONS.clear()
+
+
+# Accounts endpoint URLs for the base URLs used throughout the suite
+_EXPECTED_URLS = {
+    base_url: f"{base_url}/AIMWebService/api/Accounts"
+    for base_url in (
+        "https://ccp.example.com",
+        "https://test.com",
+        "https://test.example.com",
+        "https://secure.example.com",
+    )
+}
 
 
 class TestHelper:
@@ -165,21 +253,13 @@ class TestHelper:
     @staticmethod
     def create_mock_response(status_code=200, content=None, error_code=None, error_message=None):
         """Create a mock HTTP response for testing."""
-        mock_response = Mock()
-        mock_response.status_code = status_code
-
         if status_code == 200 and content:
-            mock_response.json.return_value = content
-            mock_response.raise_for_status.return_value = None
-        elif error_code:
-            mock_response.json.return_value = {"ErrorCode": error_code, "ErrorMessage": error_message or "Test error"}
-            mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-        else:
-            mock_response.json.side_effect = ValueError("Not JSON")
-            mock_response.text = f"HTTP {status_code} Error"
-            mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-
-        return mock_response
+            return FakeResponse.from_json(content)
+        if error_code:
+            return FakeResponse.from_json(
+                {"ErrorCode": error_code, "ErrorMessage": error_message or "Test error"}, status_code
+            )
+        return FakeResponse(status_code, f"HTTP {status_code} Error".encode())
 
     @staticmethod
     def assert_request_parameters(mock_get, expected_params):
@@ -188,9 +268,7 @@ class TestHelper:
         call_args = mock_get.call_args
         actual_params = call_args[1]["params"]
 
-        for key, value in expected_params.items():
-            assert key in actual_params, f"Parameter {key} not found in request"
-            assert actual_params[key] == value, f"Parameter {key}: expected {value}, got {actual_params[key]}"
+        assert expected_params.items() <= actual_params.items(), f"expected {expected_params}, got {actual_params}"
 
     @staticmethod
     def assert_request_url(mock_get, expected_base_url):
@@ -198,7 +276,7 @@ class TestHelper:
         assert mock_get.called
         call_args = mock_get.call_args
         actual_url = call_args[0][0]
-        expected_url = f"{expected_base_url}/AIMWebService/api/Accounts"
+        expected_url = _EXPECTED_URLS.get(expected_base_url) or f"{expected_base_url}/AIMWebService/api/Accounts"
         assert actual_url == expected_url
 
 
@@ -0,0 +1,203 @@
+"""Unit tests for the asynchronous CyberArk CCP API client."""
+
+import asyncio
+import json
+import ssl
+from unittest.mock import patch
+
+import pytest
+
+from cyberark_ccp import (
+    AsyncCyberarkCCPClient,
+    CyberarkCCPAccountNotFoundError,
+    CyberarkCCPAuthenticationError,
+    CyberarkCCPConnectionError,
+    CyberarkCCPError,
+    CyberarkCCPTimeoutError,
+    CyberarkCCPValidationError,
+    QueryFormat,
+)
+
+aiohttp = pytest.importorskip("aiohttp")
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response used as an async context manager."""
+
+    def __init__(self, status, body):
+        self.status = status
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+class FakeSession:
+    """Records GET calls and returns a canned response or raises a canned error."""
+
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+        self.calls = []
+        self.closed = False
+
+    def get(self, url, params=None):
+        self.calls.append((url, params))
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    async def close(self):
+        self.closed = True
+
+
+def json_response(status, payload):
+    return FakeResponse(status, json.dumps(payload).encode())
+
+
+def use_session(client, session):
+    """Install a fake session on the client and return it."""
+    client._session = session
+    return session
+
+
+@pytest.fixture
+def async_client():
+    """Provide a fresh client per test, since each test installs its own session."""
+    return AsyncCyberarkCCPClient("https://ccp.example.com", "TestApp")
+
+
+class TestAsyncCyberarkCCPClient:
+    """Test suite for AsyncCyberarkCCPClient."""
+
+    def test_client_initialization(self):
+        """Test async client initialization mirrors the sync client."""
+        client = AsyncCyberarkCCPClient("https://test.com/", "MyApp", timeout=60, pool_maxsize=8)
+        assert client.base_url == "https://test.com"
+        assert client.app_id == "MyApp"
+        assert client.timeout == 60
+        assert client.pool_maxsize == 8
+        assert client._session is None
+
+    @pytest.mark.parametrize("verify", [True, False])
+    @pytest.mark.parametrize("cert_path", [None, "/path/to/cert.pem"])
+    def test_session_ssl_context(self, verify, cert_path):
+        """Test the session's SSL context honours verify and always loads a configured client certificate."""
+        client = AsyncCyberarkCCPClient("https://ccp.example.com", "TestApp", cert_path=cert_path, verify=verify)
+
+        async def open_session():
+            connector = client._get_session().connector
+            await client.close()
+            return connector
+
+        with patch.object(ssl.SSLContext, "load_cert_chain") as mock_load_cert_chain:
+            connector = asyncio.run(open_session())
+
+        ssl_context = connector._ssl
+        assert isinstance(ssl_context, ssl.SSLContext)
+        assert ssl_context.check_hostname is verify
+        assert ssl_context.verify_mode == (ssl.CERT_REQUIRED if verify else ssl.CERT_NONE)
+        if cert_path:
+            mock_load_cert_chain.assert_called_once_with(cert_path)
+        else:
+            mock_load_cert_chain.assert_not_called()
+
+    def test_session_created_once(self, async_client):
+        """Test the session is created on first use and then reused."""
+
+        async def get_sessions():
+            first = async_client._get_session()
+            second = async_client._get_session()
+            await async_client.close()
+            return first, second
+
+        first, second = asyncio.run(get_sessions())
+        assert first is second
+
+    def test_get_account(self, async_client):
+        """Test successful account retrieval sends the expected request."""
+        session = use_session(async_client, FakeSession(json_response(200, {"Content": "pw", "UserName": "user"})))
+
+        result = asyncio.run(async_client.get_account(safe="TestSafe", query_format=QueryFormat.EXACT))
+
+        assert result == {"Content": "pw", "UserName": "user"}
+        url, params = session.calls[0]
+        assert url == "https://ccp.example.com/AIMWebService/api/Accounts"
+        assert params == {"AppID": "TestApp", "Safe": "TestSafe"}
+
+    def test_get_password(self, async_client):
+        """Test get_password returns only the Content field."""
+        use_session(async_client, FakeSession(json_response(200, {"Content": "pw", "UserName": "user"})))
+
+        assert asyncio.run(async_client.get_password(safe="TestSafe")) == "pw"
+
+    def test_concurrent_requests(self, async_client):
+        """Test several passwords can be gathered on one event loop."""
+        session = use_session(async_client, FakeSession(json_response(200, {"Content": "pw"})))
+
+        async def fetch_all():
+            return await asyncio.gather(*(async_client.get_password(safe=f"Safe{i}") for i in range(3)))
+
+        assert asyncio.run(fetch_all()) == ["pw", "pw", "pw"]
+        assert [params["Safe"] for _, params in session.calls] == ["Safe0", "Safe1", "Safe2"]
+
+    def test_missing_search_criteria(self, async_client):
+        """Test AppID and at least one other parameter is required."""
+        with pytest.raises(CyberarkCCPValidationError, match="AppID and at least one other parameter"):
+            asyncio.run(async_client.get_account())
+
+    def test_json_error_mapping(self, async_client):
+        """Test CCP error codes map to the same exceptions as the sync client."""
+        use_session(
+            async_client,
+            FakeSession(json_response(403, {"ErrorCode": "APPAP306E", "ErrorMessage": "App failed on authentication"})),
+        )
+
+        with pytest.raises(CyberarkCCPAuthenticationError, match=r"Authentication failed \(APPAP306E\)"):
+            asyncio.run(async_client.get_account(safe="TestSafe"))
+
+    def test_non_json_error_mapping(self, async_client):
+        """Test non-JSON error bodies are classified by status code."""
+        use_session(async_client, FakeSession(FakeResponse(404, b"Page not found")))
+
+        with pytest.raises(CyberarkCCPAccountNotFoundError, match=r"Not Found \(HTTP 404\): Page not found"):
+            asyncio.run(async_client.get_account(safe="TestSafe"))
+
+    def test_invalid_json_response(self, async_client):
+        """Test invalid JSON in a successful response."""
+        use_session(async_client, FakeSession(FakeResponse(200, b"not json")))
+
+        with pytest.raises(CyberarkCCPError, match="Invalid JSON response from server"):
+            asyncio.run(async_client.get_account(safe="TestSafe"))
+
+    def test_timeout_error(self, async_client):
+        """Test timeout error handling."""
+        use_session(async_client, FakeSession(error=asyncio.TimeoutError()))
+
+        with pytest.raises(CyberarkCCPTimeoutError, match="Request timed out after 30 seconds"):
+            asyncio.run(async_client.get_account(safe="TestSafe"))
+
+    def test_connection_error(self, async_client):
+        """Test connection error handling."""
+        use_session(async_client, FakeSession(error=aiohttp.ClientConnectionError("Connection refused")))
+
+        with pytest.raises(CyberarkCCPConnectionError, match="Connection error: Connection refused"):
+            asyncio.run(async_client.get_account(safe="TestSafe"))
+
+    def test_async_context_manager(self, async_client):
+        """Test the async context manager closes the session."""
+        session = FakeSession()
+
+        async def use_client():
+            async with async_client as client:
+                client._session = session
+
+        asyncio.run(use_client())
+        assert session.closed
+        assert async_client._session is None
@@ -1,9 +1,21 @@
 """Comprehensive unit tests for CyberArk CCP API client."""
 
-from unittest.mock import Mock, patch
+import pickle
+import re
+import shutil
+import ssl
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
 
 import pytest
 import requests
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import RequestException, Timeout
 
 from cyberark_ccp import (
     CyberarkCCPAccountNotFoundError,
@@ -17,16 +29,225 @@ from cyberark_ccp import (
     QueryFormat,
 )
 
+from .conftest import FakeResponse
+
+ACCOUNTS_URL = "https://test.com/AIMWebService/api/Accounts"
+
+# Characters the specification forbids in URL values
+INVALID_URL_CHARS = ("+", "&", "%", ";")
+
+# FakeResponse is frozen, so these canned responses are built once and shared by every test
+PASSWORD_RESPONSE = FakeResponse.from_json({"Content": "test-password"})
+ACCOUNT_RESPONSE = FakeResponse.from_json(
+    {
+        "Content": "test-password",
+        "UserName": "test-user",
+        "Address": "test.example.com",
+        "Database": "test-db",
+        "PasswordChangeInProcess": False,
+    }
+)
+
+STANDARD_KWARGS = {
+    "safe": "TestSafe",
+    "folder": "TestFolder",
+    "password_object": "TestObject",
+    "username": "TestUser",
+    "address": "test.example.com",
+    "database": "TestDB",
+    "policy_id": "TestPolicy",
+    "reason": "TestReason",
+}
+STANDARD_PARAMS = {
+    "AppID": "TestApp",
+    "Safe": "TestSafe",
+    "Folder": "TestFolder",
+    "Object": "TestObject",
+    "UserName": "TestUser",
+    "Address": "test.example.com",
+    "Database": "TestDB",
+    "PolicyID": "TestPolicy",
+    "Reason": "TestReason",
+}
+
+
+# Documented CCP error codes: (status, code, message, exception, expected message)
+API_ERROR_CASES = [
+    (400, "AIMWS030E", "Invalid query format", CyberarkCCPValidationError, "Invalid query format (AIMWS030E)"),
+    (400, "APPAP227E", "Too many objects", CyberarkCCPAccountNotFoundError, "Too many objects (APPAP227E)"),
+    (400, "APPAP228E", "Too many objects", CyberarkCCPAccountNotFoundError, "Too many objects (APPAP228E)"),
+    (400, "APPAP229E", "Too many objects", CyberarkCCPAccountNotFoundError, "Too many objects (APPAP229E)"),
+    (
+        400,
+        "APPAP007E",
+        "Connection to the Vault has failed",
+        CyberarkCCPConnectionError,
+        "Connection to Vault failed (APPAP007E)",
+    ),
+    (
+        400,
+        "APPAP081E",
+        "Request message content is invalid",
+        CyberarkCCPValidationError,
+        "Request validation error (APPAP081E)",
+    ),
+    (
+        400,
+        "CASVL010E",
+        "Invalid characters in User Name",
+        CyberarkCCPValidationError,
+        "Request validation error (CASVL010E)",
+    ),
+    (
+        400,
+        "AIMWS031E",
+        "Invalid request. The AppID parameter is required",
+        CyberarkCCPValidationError,
+        "Request validation error (AIMWS031E)",
+    ),
+    (
+        403,
+        "APPAP306E",
+        "App failed on authentication check",
+        CyberarkCCPAuthenticationError,
+        "Authentication failed (APPAP306E)",
+    ),
+    (
+        403,
+        "APPAP008E",
+        "ITATS982E User app11 is not defined",
+        CyberarkCCPAuthorizationError,
+        "User not defined (APPAP008E)",
+    ),
+    (404, "APPAP004E", "Safe not found", CyberarkCCPAccountNotFoundError, "Safe not found (APPAP004E)"),
+    (
+        500,
+        "APPAP282E",
+        "Password [password] is currently being changed by the CPM",
+        CyberarkCCPError,
+        "Password change in progress (APPAP282E)",
+    ),
+]
+
+
+# Clients are stateless between calls unless caching is enabled, so one per module is enough.
+# The basic `client` fixture is shared from conftest.py.
+@pytest.fixture(scope="module")
+def verified_client():
+    """Provide a shared client with explicit verification and timeout settings."""
+    client = CyberarkCCPClient(base_url="https://ccp.example.com", app_id="TestApp", verify=True, timeout=30)
+    yield client
+    client.close()
+
+
+class _ScriptedCCPHandler(BaseHTTPRequestHandler):
+    """Answer each GET with the server's next scripted (delay, status, body[, headers]) step."""
+
+    def do_GET(self):
+        server = self.server
+        server.request_count += 1
+        delay, status, body, *headers = server.script.popleft() if len(server.script) > 1 else server.script[0]
+        time.sleep(delay)
+        self.send_response(status)
+        for name, value in headers[0].items() if headers else ():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _ScriptedCCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    block_on_close = False
+
+    def handle_error(self, request, client_address):
+        # A client that timed out closes the socket before a delayed step writes its response
+        pass
+
+
+def _serve_ccp(server_ssl_context=None):
+    """Start a scripted loopback server, optionally over TLS, and return it."""
+    server = _ScriptedCCPServer(("127.0.0.1", 0), _ScriptedCCPHandler)
+    scheme = "http"
+    if server_ssl_context is not None:
+        server.socket = server_ssl_context.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    server.script = deque([(0, 200, b'{"Content": "local-password"}')])
+    server.request_count = 0
+    server.url = f"{scheme}://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    return server
+
+
+@pytest.fixture
+def local_ccp():
+    """Run a loopback HTTP server so requests go through the client's real mounted adapter.
+
+    Tests set ``local_ccp.script`` to the steps to replay; the last step repeats.
+    """
+    server = _serve_ccp()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="module")
+def tls_files(tmp_path_factory):
+    """Generate a private CA and a server certificate for 127.0.0.1 with the openssl CLI."""
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        pytest.skip("openssl is required to generate test certificates")
+    path = tmp_path_factory.mktemp("tls")
+    extensions = path / "server.ext"
+    extensions.write_text(
+        "subjectAltName=IP:127.0.0.1\n"
+        "basicConstraints=CA:FALSE\n"
+        "keyUsage=digitalSignature,keyEncipherment\n"
+        "extendedKeyUsage=serverAuth\n"
+        "subjectKeyIdentifier=hash\n"
+        "authorityKeyIdentifier=keyid\n"
+    )
+    commands = [
+        [openssl, "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "2", "-subj", "/CN=Test CCP CA"]
+        + ["-keyout", "ca.key", "-out", "ca.pem"]
+        + ["-addext", "basicConstraints=critical,CA:TRUE", "-addext", "keyUsage=critical,keyCertSign,cRLSign"],
+        [openssl, "req", "-newkey", "rsa:2048", "-nodes", "-subj", "/CN=127.0.0.1"]
+        + ["-keyout", "server.key", "-out", "server.csr"],
+        [openssl, "x509", "-req", "-in", "server.csr", "-CA", "ca.pem", "-CAkey", "ca.key", "-CAcreateserial"]
+        + ["-days", "2", "-out", "server.pem", "-extfile", "server.ext"],
+    ]
+    for command in commands:
+        subprocess.run(command, cwd=path, check=True, capture_output=True)
+    return path
+
+
+@pytest.fixture
+def local_tls_ccp(tls_files):
+    """Run a loopback HTTPS server with a certificate issued by the private test CA."""
+    server_ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_ssl_context.load_cert_chain(tls_files / "server.pem", tls_files / "server.key")
+    server = _serve_ccp(server_ssl_context)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cache_client():
+    """Provide a fresh caching client per test, since the cache carries state between calls."""
+    client = CyberarkCCPClient("https://test.com", "TestApp", cache_ttl=60)
+    yield client
+    client.close()
+
 
 class TestCyberarkCCPClient:
     """Test suite for CyberarkCCPClient class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.base_url = "https://ccp.example.com"
-        self.app_id = "TestApp"
-        self.client = CyberarkCCPClient(base_url=self.base_url, app_id=self.app_id, verify=True, timeout=30)
-
     def test_client_initialization(self):
         """Test client initialization with various parameters."""
         # Test basic initialization
@@ -51,49 +272,177 @@ class TestCyberarkCCPClient:
         assert client.verify is False
         assert client.timeout == 60
 
-    def test_context_manager(self):
+    def test_connection_pool_configuration(self):
+        """Test the session mounts a pooled adapter with retries for both schemes."""
+        client = CyberarkCCPClient("https://test.com", "MyApp", pool_maxsize=64)
+
+        for prefix in ("https://", "http://"):
+            adapter = client._session.get_adapter(f"{prefix}test.com")
+            assert adapter._pool_maxsize == 64
+            assert adapter.max_retries.total == 3
+            assert adapter.max_retries.connect == 0
+            assert adapter.max_retries.respect_retry_after_header is False
+            assert 503 in adapter.max_retries.status_forcelist
+
+    def test_read_timeout_is_not_retried(self, local_ccp):
+        """Test a slow server raises CyberarkCCPTimeoutError after one timeout instead of being retried."""
+        local_ccp.script = deque([(1.0, 200, b'{"Content": "late"}')])
+
+        with CyberarkCCPClient(local_ccp.url, "MyApp", timeout=0.3) as client:
+            with pytest.raises(CyberarkCCPTimeoutError, match="Request timed out after 0.3 seconds"):
+                client.get_password(safe="TestSafe")
+
+        assert local_ccp.request_count == 1
+
+    def test_gateway_errors_are_retried(self, local_ccp):
+        """Test transient 503 responses are retried by the mounted adapter."""
+        local_ccp.script = deque([(0, 503, b""), (0, 503, b""), (0, 200, b'{"Content": "recovered"}')])
+
+        with CyberarkCCPClient(local_ccp.url, "MyApp") as client:
+            assert client.get_password(safe="TestSafe") == "recovered"
+
+        assert local_ccp.request_count == 3
+
+    def test_retry_after_header_is_ignored(self, local_ccp):
+        """Test a 503 asking for a long Retry-After is retried after the short backoff instead of blocking."""
+        local_ccp.script = deque([(0, 503, b"", {"Retry-After": "3600"}), (0, 200, b'{"Content": "recovered"}')])
+
+        # Record the backoff sleeps instead of taking them, so a regression fails rather than hangs
+        with patch("urllib3.util.retry.time.sleep") as mock_sleep:
+            with CyberarkCCPClient(local_ccp.url, "MyApp", timeout=5) as client:
+                assert client.get_password(safe="TestSafe") == "recovered"
+
+        assert all(call.args[0] < 1 for call in mock_sleep.call_args_list)
+        assert local_ccp.request_count == 2
+
+    def test_session_headers(self, verified_client):
+        """Test the session asks for uncompressed JSON over a kept-alive connection."""
+        headers = verified_client._session.headers
+        assert headers["Accept"] == "application/json"
+        assert headers["Accept-Encoding"] == "identity"
+        assert headers["Connection"] == "keep-alive"
+
+    def test_ssl_context_shared_by_pooled_connections(self, mock_get):
+        """Test a supplied SSL context is mounted on the pool and replaces per-request cert and verify."""
+        ssl_context = ssl.create_default_context()
+        client = CyberarkCCPClient(
+            "https://test.com",
+            "MyApp",
+            cert_path="/path/to/cert.pem",
+            verify="/path/to/ca.pem",
+            ssl_context=ssl_context,
+        )
+        mock_get.return_value = PASSWORD_RESPONSE
+
+        client.get_password(safe="TestSafe")
+
+        adapter = client._session.get_adapter("https://test.com")
+        assert adapter.poolmanager.connection_pool_kw["ssl_context"] is ssl_context
+        assert mock_get.call_args[1]["cert"] is None
+
+    def test_ssl_context_trust_store_left_unchanged(self, local_tls_ccp, tls_files):
+        """Test the caller's context is used as-is: no CA bundle is loaded into it on new connections."""
+        ssl_context = ssl.create_default_context(cafile=str(tls_files / "ca.pem"))
+        cert_store_stats = ssl_context.cert_store_stats()
+
+        with patch.object(ssl_context, "load_verify_locations", wraps=ssl_context.load_verify_locations) as mock_load:
+            with CyberarkCCPClient(local_tls_ccp.url, "MyApp", ssl_context=ssl_context) as client:
+                # The server closes each connection, so every request handshakes on a new one
+                for _ in range(3):
+                    assert client.get_password(safe="TestSafe") == "local-password"
+
+        assert local_tls_ccp.request_count == 3
+        mock_load.assert_not_called()
+        assert ssl_context.cert_store_stats() == cert_store_stats
+
+    def test_ssl_context_applied_to_proxied_connections(self):
+        """Test the SSL context also reaches pools opened through a proxy (e.g. from HTTPS_PROXY)."""
+        ssl_context = ssl.create_default_context()
+        client = CyberarkCCPClient("https://test.com", "MyApp", ssl_context=ssl_context)
+        adapter = client._session.get_adapter("https://test.com")
+        request = requests.Request("GET", ACCOUNTS_URL).prepare()
+
+        pool = adapter.get_connection_with_tls_context(
+            request, verify=True, proxies={"https": "http://proxy.example.com:8080"}
+        )
+
+        assert adapter.proxy_manager["http://proxy.example.com:8080"].connection_pool_kw["ssl_context"] is ssl_context
+        assert pool.conn_kw["ssl_context"] is ssl_context
+
+    def test_ssl_context_adapter_is_not_pickled_without_its_context(self):
+        """Test pickling an adapter that holds an SSL context fails instead of silently dropping the context."""
+        client = CyberarkCCPClient("https://test.com", "MyApp", ssl_context=ssl.create_default_context())
+
+        with pytest.raises(TypeError, match="SSLContext"):
+            pickle.dumps(client._session.get_adapter("https://test.com"))
+
+    @pytest.mark.usefixtures("clear_shared_sessions")
+    def test_shared_clients_reuse_session(self):
+        """Test shared clients reuse one session per pool configuration and leave it open on close."""
+        first = CyberarkCCPClient.shared("https://ccp1.example.com", "AppOne")
+        second = CyberarkCCPClient.shared("https://ccp2.example.com", "AppTwo", cert_path="/path/to/cert.pem")
+        other = CyberarkCCPClient.shared("https://ccp1.example.com", "AppOne", pool_maxsize=4)
+
+        assert first._session is second._session
+        assert other._session is not first._session
+        assert second._cert_arg == "/path/to/cert.pem"
+
+        with patch.object(first._session, "close") as mock_close:
+            first.close()
+            mock_close.assert_not_called()
+
+    def test_injected_session_is_not_closed(self):
+        """Test a caller-supplied session is used as-is and not closed by the client."""
+        session = requests.Session()
+        client = CyberarkCCPClient("https://test.com", "MyApp", session=session)
+
+        assert client._session is session
+        with patch.object(session, "close") as mock_close:
+            client.close()
+            mock_close.assert_not_called()
+
+    def test_client_uses_slots(self, verified_client):
+        """Test client attributes live in slots while instances still accept extra attributes."""
+        assert verified_client.__dict__ == {}
+        client = CyberarkCCPClient("https://test.com", "MyApp")
+        client.extra_attribute = True
+        assert client.__dict__ == {"extra_attribute": True}
+
+    def test_instance_methods_can_be_patched(self, verified_client):
+        """Test a method can be patched on a single client instance."""
+        with patch.object(verified_client, "get_password", return_value="patched") as mock_get_password:
+            assert verified_client.get_password(safe="TestSafe") == "patched"
+
+        mock_get_password.assert_called_once_with(safe="TestSafe")
+        assert "get_password" not in verified_client.__dict__
+
+    def test_package_import_defers_http_libraries(self):
+        """Test importing the package does not load requests or aiohttp until a client is created."""
+        code = "import sys, cyberark_ccp; print(sorted(m for m in ('requests', 'aiohttp') if m in sys.modules))"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "[]"
+
+    def test_context_manager(self, verified_client):
         """Test client as context manager."""
-        with patch.object(self.client, "close") as mock_close:
-            with self.client as client:
-                assert client is self.client
+        with patch.object(CyberarkCCPClient, "close") as mock_close:
+            with verified_client as client:
+                assert client is verified_client
             mock_close.assert_called_once()
 
-    def test_build_params_basic(self):
+    def test_build_params_basic(self, verified_client):
         """Test parameter building with basic parameters."""
-        params = self.client._build_params(safe="TestSafe", password_object="TestObject")
+        params = verified_client._build_params(safe="TestSafe", password_object="TestObject")
 
         expected = {"AppID": "TestApp", "Safe": "TestSafe", "Object": "TestObject"}
         assert params == expected
 
-    def test_build_params_all_standard_parameters(self):
+    def test_build_params_all_standard_parameters(self, verified_client):
         """Test parameter building with all standard parameters."""
-        params = self.client._build_params(
-            safe="TestSafe",
-            folder="TestFolder",
-            password_object="TestObject",
-            username="TestUser",
-            address="test.example.com",
-            database="TestDB",
-            policy_id="TestPolicy",
-            reason="TestReason",
-        )
+        assert verified_client._build_params(**STANDARD_KWARGS) == STANDARD_PARAMS
 
-        expected = {
-            "AppID": "TestApp",
-            "Safe": "TestSafe",
-            "Folder": "TestFolder",
-            "Object": "TestObject",
-            "UserName": "TestUser",
-            "Address": "test.example.com",
-            "Database": "TestDB",
-            "PolicyID": "TestPolicy",
-            "Reason": "TestReason",
-        }
-        assert params == expected
-
-    def test_build_params_query_overrides_others(self):
+    def test_build_params_query_overrides_others(self, verified_client):
         """Test that Query parameter overrides other search criteria per API spec."""
-        params = self.client._build_params(
+        params = verified_client._build_params(
             query="Safe=TestSafe,Object=TestObject",
             query_format=QueryFormat.EXACT,
             safe="IgnoredSafe",  # Should be ignored
@@ -112,93 +461,79 @@ class TestCyberarkCCPClient:
         assert "Safe" not in params
         assert "Object" not in params
 
-    def test_build_params_query_format_exact(self):
+    def test_build_params_query_format_exact(self, verified_client):
         """Test Query Format parameter with Exact value."""
-        params = self.client._build_params(query="Safe=TestSafe", query_format=QueryFormat.EXACT)
+        params = verified_client._build_params(query="Safe=TestSafe", query_format=QueryFormat.EXACT)
 
         assert params["Query Format"] == "Exact"
 
-    def test_build_params_query_format_regexp(self):
+    def test_build_params_query_format_regexp(self, verified_client):
         """Test Query Format parameter with Regexp value."""
-        params = self.client._build_params(query="Safe=Test.*", query_format=QueryFormat.REGEXP)
+        params = verified_client._build_params(query="Safe=Test.*", query_format=QueryFormat.REGEXP)
 
         assert params["Query Format"] == "Regexp"
 
-    def test_build_params_connection_timeout(self):
+    def test_build_params_connection_timeout(self, verified_client):
         """Test Connection Timeout parameter."""
-        params = self.client._build_params(safe="TestSafe", connection_timeout=60)
+        params = verified_client._build_params(safe="TestSafe", connection_timeout=60)
 
         assert params["Connection Timeout"] == "60"
 
-    def test_build_params_connection_timeout_validation(self):
+    def test_build_params_connection_timeout_validation(self, verified_client):
         """Test Connection Timeout parameter validation."""
         with pytest.raises(CyberarkCCPValidationError, match="Connection timeout must be positive"):
-            self.client._build_params(safe="TestSafe", connection_timeout=0)
+            verified_client._build_params(safe="TestSafe", connection_timeout=0)
 
         with pytest.raises(CyberarkCCPValidationError, match="Connection timeout must be positive"):
-            self.client._build_params(safe="TestSafe", connection_timeout=-1)
+            verified_client._build_params(safe="TestSafe", connection_timeout=-1)
 
-    def test_build_params_fail_request_on_password_change(self):
+    def test_build_params_fail_request_on_password_change(self, verified_client):
         """Test FailRequestOnPasswordChange parameter."""
         # Test True value
-        params = self.client._build_params(safe="TestSafe", fail_request_on_password_change=True)
+        params = verified_client._build_params(safe="TestSafe", fail_request_on_password_change=True)
         assert params["FailRequestOnPasswordChange"] == "true"
 
         # Test False value
-        params = self.client._build_params(safe="TestSafe", fail_request_on_password_change=False)
+        params = verified_client._build_params(safe="TestSafe", fail_request_on_password_change=False)
         assert params["FailRequestOnPasswordChange"] == "false"
 
-    def test_validate_url_value_valid(self):
+    def test_validate_url_value_valid(self, verified_client):
         """Test URL value validation with valid inputs."""
         # These should not raise exceptions
-        self.client._validate_url_value("ValidValue", "Test")
-        self.client._validate_url_value("Valid123", "Test")
-        self.client._validate_url_value("Valid_Value", "Test")
-        self.client._validate_url_value("Valid-Value", "Test")
+        verified_client._validate_url_value("ValidValue", "Test")
+        verified_client._validate_url_value("Valid123", "Test")
+        verified_client._validate_url_value("Valid_Value", "Test")
+        verified_client._validate_url_value("Valid-Value", "Test")
 
-    def test_validate_url_value_invalid_characters(self):
+    @pytest.mark.parametrize("char", INVALID_URL_CHARS)
+    def test_validate_url_value_invalid_characters(self, verified_client, char):
         """Test URL value validation with invalid characters per API spec."""
-        invalid_chars = ["+", "&", "%", ";"]
-
-        for char in invalid_chars:
-            with pytest.raises(CyberarkCCPValidationError) as exc_info:
-                self.client._validate_url_value(f"test{char}value", "TestParam")
-
-            assert f"invalid character '{char}'" in str(exc_info.value)
-            assert "are not supported" in str(exc_info.value)
+        with pytest.raises(
+            CyberarkCCPValidationError, match=re.escape(f"invalid character '{char}'") + ".*are not supported"
+        ):
+            verified_client._validate_url_value(f"test{char}value", "TestParam")
 
-    def test_validate_url_value_spaces(self):
+    def test_validate_url_value_spaces(self, verified_client):
         """Test URL value validation with spaces."""
-        with pytest.raises(CyberarkCCPValidationError) as exc_info:
-            self.client._validate_url_value("test value", "TestParam")
+        with pytest.raises(CyberarkCCPValidationError, match="contains spaces which are not allowed in URLs"):
+            verified_client._validate_url_value("test value", "TestParam")
 
-        assert "contains spaces" in str(exc_info.value)
-        assert "not allowed in URLs" in str(exc_info.value)
+    def test_validate_url_value_reports_restricted_character_before_space(self, verified_client):
+        """Test restricted characters take precedence over spaces in the error message."""
+        with pytest.raises(CyberarkCCPValidationError, match="invalid character '&'"):
+            verified_client._validate_url_value("test value&more", "TestParam")
 
-    def test_appid_and_one_other_parameter_validation(self):
+    def test_appid_and_one_other_parameter_validation(self, verified_client):
         """Test that AppID and at least one other parameter is required per API spec."""
-        with pytest.raises(CyberarkCCPValidationError) as exc_info:
-            self.client.get_account()
-
-        assert "AppID and at least one other parameter" in str(exc_info.value)
+        with pytest.raises(CyberarkCCPValidationError, match="AppID and at least one other parameter"):
+            verified_client.get_account()
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_successful_request(self, mock_get):
+    def test_successful_request(self, mock_get, verified_client):
         """Test successful API request."""
         # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "Content": "test-password",
-            "UserName": "test-user",
-            "Address": "test.example.com",
-            "Database": "test-db",
-            "PasswordChangeInProcess": False,
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = ACCOUNT_RESPONSE
 
-        result = self.client.get_account(safe="TestSafe")
+        result = verified_client.get_account(safe="TestSafe")
 
         # Verify request was made correctly
         mock_get.assert_called_once()
@@ -216,28 +551,45 @@ class TestCyberarkCCPClient:
         assert result["Database"] == "test-db"
         assert result["PasswordChangeInProcess"] is False
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_get_password_method(self, mock_get):
-        """Test get_password method returns only Content field."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"Content": "test-password", "UserName": "test-user"}
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+    @pytest.mark.parametrize(
+        "body, expected",
+        [
+            (b'{"UserName": "user", "Content" : "p@ss-w0rd", "Address": "host"}', "p@ss-w0rd"),
+            ('{"Content": "pässwörd"}'.encode(), "pässwörd"),
+            (b'{"Content": "quo\\"te\\\\slash\\u00e9"}', 'quo"te\\slash\u00e9'),
+            (b'{"Content": null}', "None"),
+            (b'{"UserName": "user"}', ""),
+            (b'{"Meta": {"Content": "nested"}, "Content": "top-level"}', "top-level"),
+            (b'{"Meta": {"Content": "nested"}}', ""),
+            (b'{"UserName": "a{b", "Content": "p@ss"}', "p@ss"),
+        ],
+    )
+    def test_get_password_content_extraction(self, mock_get, body, expected, verified_client):
+        """Test get_password reads Content directly, falling back to a full decode for escaped values."""
+        mock_get.return_value.content = body
+
+        assert verified_client.get_password(safe="TestSafe") == expected
+
+    def test_get_password_skips_full_decode(self, mock_get, verified_client):
+        """Test get_password returns only the Content field, without decoding the whole body."""
+        mock_get.return_value.content = b'{"Content": "test-password", "UserName": "test-user"}'
+
+        with patch("cyberark_ccp.client._json_loads") as mock_loads:
+            assert verified_client.get_password(safe="TestSafe") == "test-password"
+        mock_loads.assert_not_called()
+
+    def test_get_password_invalid_utf8_content(self, mock_get, verified_client):
+        """Test undecodable Content bytes raise CyberarkCCPError like the full JSON decode does."""
+        mock_get.return_value.content = b'{"Content": "bad-\xff-bytes"}'
+
+        with pytest.raises(CyberarkCCPError, match="Invalid JSON response from server"):
+            verified_client.get_password(safe="TestSafe")
 
-        password = self.client.get_password(safe="TestSafe")
-        assert password == "test-password"
-
-    @patch("cyberark_ccp.client.requests.Session.get")
     def test_certificate_authentication(self, mock_get):
         """Test certificate-based authentication."""
         client = CyberarkCCPClient(base_url="https://test.com", app_id="TestApp", cert_path="/path/to/cert.p12")
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"Content": "test-password"}
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = PASSWORD_RESPONSE
 
         client.get_password(safe="TestSafe")
 
@@ -245,235 +597,241 @@ class TestCyberarkCCPClient:
         call_args = mock_get.call_args
         assert call_args[1]["cert"] == "/path/to/cert.p12"
 
+    def test_empty_cert_path_sends_no_certificate(self, mock_get):
+        """Test an empty cert_path is normalised to no client certificate."""
+        client = CyberarkCCPClient(base_url="https://test.com", app_id="TestApp", cert_path="", verify=False)
+        mock_get.return_value = PASSWORD_RESPONSE
 
-class TestErrorHandling:
-    """Test suite for error handling according to API specification."""
+        client.get_password(safe="TestSafe")
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.client = CyberarkCCPClient("https://test.com", "TestApp")
+        assert mock_get.call_args[1]["cert"] is None
+        assert mock_get.call_args[1]["verify"] is False
 
-    def create_mock_error_response(self, status_code, error_code=None, error_message="Test error"):
-        """Create a mock error response."""
-        mock_response = Mock()
-        mock_response.status_code = status_code
+    def test_get_passwords_batch(self, mock_get, verified_client):
+        """Test batch retrieval returns passwords in query order and captures per-query errors."""
 
-        if error_code:
-            mock_response.json.return_value = {"ErrorCode": error_code, "ErrorMessage": error_message}
-        else:
-            mock_response.json.side_effect = ValueError("Not JSON")
-            mock_response.text = f"HTTP {status_code} Error"
+        def respond(url, params, **kwargs):
+            if params["Safe"] == "MissingSafe":
+                return FakeResponse.from_json(
+                    {"ErrorCode": "APPAP004E", "ErrorMessage": "Password object not found"}, 404
+                )
+            return FakeResponse.from_json({"Content": f"{params['Safe']}-password"})
 
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-        return mock_response
+        mock_get.side_effect = respond
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_400_error_aimws030e_invalid_query_format(self, mock_get):
-        """Test 400 error with AIMWS030E (Invalid query format)."""
-        mock_get.return_value = self.create_mock_error_response(400, "AIMWS030E", "Invalid query format")
+        results = verified_client.get_passwords_batch(
+            [{"safe": "SafeA"}, {"safe": "MissingSafe"}, {}, {"safe": "SafeB", "reason": "Batch"}]
+        )
 
-        with pytest.raises(CyberarkCCPValidationError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+        assert results[0] == "SafeA-password"
+        assert isinstance(results[1], CyberarkCCPAccountNotFoundError)
+        assert isinstance(results[2], CyberarkCCPValidationError)
+        assert results[3] == "SafeB-password"
+        assert mock_get.call_count == 3
 
-        assert "Invalid query format (AIMWS030E)" in str(exc_info.value)
+    @patch("concurrent.futures.ThreadPoolExecutor")
+    def test_get_passwords_batch_caps_workers_at_pool_size(self, mock_executor):
+        """Test batch workers never exceed the connection pool size."""
+        client = CyberarkCCPClient("https://test.com", "MyApp", pool_maxsize=4)
+        mock_executor.return_value.__enter__.return_value.map.return_value = []
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_400_error_appap227e_too_many_objects(self, mock_get):
-        """Test 400 error with APPAP227E (Too many objects)."""
-        mock_get.return_value = self.create_mock_error_response(400, "APPAP227E", "Too many objects")
+        client.get_passwords_batch([], max_workers=16)
 
-        with pytest.raises(CyberarkCCPAccountNotFoundError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+        mock_executor.assert_called_once_with(max_workers=4)
 
-        assert "Too many objects (APPAP227E)" in str(exc_info.value)
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_400_error_appap228e_too_many_objects(self, mock_get):
-        """Test 400 error with APPAP228E (Too many objects)."""
-        mock_get.return_value = self.create_mock_error_response(400, "APPAP228E", "Too many objects")
+class TestCredentialCache:
+    """Test suite for the optional in-process account cache."""
 
-        with pytest.raises(CyberarkCCPAccountNotFoundError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+    def test_cache_disabled_by_default(self, mock_get, client):
+        """Test every call reaches the server when no TTL is configured."""
+        mock_get.return_value = PASSWORD_RESPONSE
 
-        assert "Too many objects (APPAP228E)" in str(exc_info.value)
+        client.get_password(safe="TestSafe")
+        client.get_password(safe="TestSafe")
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_400_error_appap229e_too_many_objects(self, mock_get):
-        """Test 400 error with APPAP229E (Too many objects)."""
-        mock_get.return_value = self.create_mock_error_response(400, "APPAP229E", "Too many objects")
+        assert mock_get.call_count == 2
 
-        with pytest.raises(CyberarkCCPAccountNotFoundError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+    def test_cache_hit_ignores_reason(self, mock_get, cache_client):
+        """Test repeated lookups within the TTL are served from the cache."""
+        mock_get.return_value = PASSWORD_RESPONSE
 
-        assert "Too many objects (APPAP229E)" in str(exc_info.value)
+        first = cache_client.get_account(safe="TestSafe", reason="First")
+        first["Content"] = "mutated"
+        second = cache_client.get_account(safe="TestSafe", reason="Second")
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_400_error_appap007e_connection_to_vault_failed(self, mock_get):
-        """Test 400 error with APPAP007E (Connection to Vault failed)."""
-        mock_get.return_value = self.create_mock_error_response(400, "APPAP007E", "Connection to the Vault has failed")
+        assert mock_get.call_count == 1
+        assert second == {"Content": "test-password"}
 
-        with pytest.raises(CyberarkCCPConnectionError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+    def test_cache_keyed_by_search_criteria(self, mock_get, cache_client):
+        """Test different search criteria are cached separately."""
+        mock_get.return_value = PASSWORD_RESPONSE
 
-        assert "Connection to Vault failed (APPAP007E)" in str(exc_info.value)
+        cache_client.get_password(safe="SafeA")
+        cache_client.get_password(safe="SafeB")
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_400_error_appap081e_invalid_request_content(self, mock_get):
-        """Test 400 error with APPAP081E (Invalid request message content)."""
-        mock_get.return_value = self.create_mock_error_response(400, "APPAP081E", "Request message content is invalid")
+        assert mock_get.call_count == 2
 
-        with pytest.raises(CyberarkCCPValidationError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+    @patch("cyberark_ccp.client.time.monotonic")
+    def test_cache_entry_expires(self, mock_monotonic, mock_get, cache_client):
+        """Test entries older than the TTL are fetched again."""
+        mock_get.return_value = PASSWORD_RESPONSE
+        mock_monotonic.side_effect = [0.0, 30.0, 90.0, 90.0]
 
-        assert "Request validation error (APPAP081E)" in str(exc_info.value)
+        cache_client.get_password(safe="TestSafe")
+        cache_client.get_password(safe="TestSafe")
+        cache_client.get_password(safe="TestSafe")
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_400_error_casvl010e_invalid_characters(self, mock_get):
-        """Test 400 error with CASVL010E (Invalid characters in User Name)."""
-        mock_get.return_value = self.create_mock_error_response(400, "CASVL010E", "Invalid characters in User Name")
+        assert mock_get.call_count == 2
 
-        with pytest.raises(CyberarkCCPValidationError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+    def test_cache_evicts_least_recently_used(self, mock_get):
+        """Test the cache holds at most cache_maxsize entries, evicting the least recently used one."""
+        mock_get.return_value = PASSWORD_RESPONSE
+        client = CyberarkCCPClient("https://test.com", "TestApp", cache_ttl=60, cache_maxsize=2)
 
-        assert "Request validation error (CASVL010E)" in str(exc_info.value)
+        client.get_password(safe="SafeA")
+        client.get_password(safe="SafeB")
+        client.get_password(safe="SafeA")  # hit: SafeB is now least recently used
+        client.get_password(safe="SafeC")
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_400_error_aimws031e_appid_required(self, mock_get):
-        """Test 400 error with AIMWS031E (AppID parameter required)."""
-        mock_get.return_value = self.create_mock_error_response(
-            400, "AIMWS031E", "Invalid request. The AppID parameter is required"
-        )
+        assert mock_get.call_count == 3
+        assert [dict(key)["Safe"] for key in client._cache] == ["SafeA", "SafeC"]
 
-        with pytest.raises(CyberarkCCPValidationError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+    @patch("cyberark_ccp.client.time.monotonic")
+    def test_expired_entries_pruned_on_store(self, mock_monotonic, mock_get, cache_client):
+        """Test storing an entry drops other expired entries instead of keeping them until read again."""
+        mock_get.return_value = PASSWORD_RESPONSE
+        mock_monotonic.side_effect = [0.0, 45.0, 90.0]
 
-        assert "Request validation error (AIMWS031E)" in str(exc_info.value)
+        cache_client.get_password(safe="SafeA")
+        cache_client.get_password(safe="SafeB")
+        cache_client.get_password(safe="SafeC")
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_403_error_appap306e_authentication_failed(self, mock_get):
-        """Test 403 error with APPAP306E (App failed on authentication check)."""
-        mock_get.return_value = self.create_mock_error_response(403, "APPAP306E", "App failed on authentication check")
+        # SafeA expired at 60s; SafeB is still within its TTL
+        assert [dict(key)["Safe"] for key in cache_client._cache] == ["SafeB", "SafeC"]
 
-        with pytest.raises(CyberarkCCPAuthenticationError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+    def test_password_change_in_progress_not_cached(self, mock_get, cache_client):
+        """Test a password being changed by the CPM is not cached."""
+        mock_get.return_value = FakeResponse.from_json({"Content": "old", "PasswordChangeInProcess": True})
 
-        assert "Authentication failed (APPAP306E)" in str(exc_info.value)
+        cache_client.get_password(safe="TestSafe")
+        cache_client.get_password(safe="TestSafe")
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_403_error_appap008e_user_not_defined(self, mock_get):
-        """Test 403 error with APPAP008E (User not defined)."""
-        mock_get.return_value = self.create_mock_error_response(403, "APPAP008E", "ITATS982E User app11 is not defined")
+        assert mock_get.call_count == 2
 
-        with pytest.raises(CyberarkCCPAuthorizationError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+    def test_invalidate_cache(self, mock_get, cache_client):
+        """Test invalidating a single entry and the whole cache."""
+        mock_get.return_value = PASSWORD_RESPONSE
 
-        assert "User not defined (APPAP008E)" in str(exc_info.value)
+        cache_client.get_password(safe="SafeA")
+        cache_client.get_password(safe="SafeB")
+        cache_client.invalidate_cache(safe="SafeA")
+        cache_client.get_password(safe="SafeA")
+        cache_client.get_password(safe="SafeB")
+        assert mock_get.call_count == 3
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_404_error_appap004e_safe_not_found(self, mock_get):
-        """Test 404 error with APPAP004E (Safe not found)."""
-        mock_get.return_value = self.create_mock_error_response(404, "APPAP004E", "Safe not found")
+        cache_client.invalidate_cache()
+        cache_client.get_password(safe="SafeB")
+        assert mock_get.call_count == 4
 
-        with pytest.raises(CyberarkCCPAccountNotFoundError) as exc_info:
-            self.client.get_account(safe="TestSafe")
 
-        assert "Safe not found (APPAP004E)" in str(exc_info.value)
+class TestErrorHandling:
+    """Test suite for error handling according to API specification."""
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_500_error_appap282e_password_change_in_progress(self, mock_get):
-        """Test 500 error with APPAP282E (Password change in progress)."""
-        mock_get.return_value = self.create_mock_error_response(
-            500, "APPAP282E", "Password [password] is currently being changed by the CPM"
+    @pytest.mark.parametrize(
+        "status,code,message,exception,expected", API_ERROR_CASES, ids=[case[1] for case in API_ERROR_CASES]
+    )
+    def test_api_error_code(self, requests_mock, client, status, code, message, exception, expected):
+        """Test documented CCP error codes map to their exception and message."""
+        requests_mock.get(ACCOUNTS_URL, status_code=status, json={"ErrorCode": code, "ErrorMessage": message})
+
+        with pytest.raises(exception, match=re.escape(expected)):
+            client.get_account(safe="TestSafe")
+
+    @pytest.mark.parametrize(
+        "status,exception,expected",
+        [
+            (400, CyberarkCCPValidationError, "Bad Request (HTTP 400)"),
+            (403, CyberarkCCPAuthenticationError, "Forbidden (HTTP 403)"),
+            (404, CyberarkCCPAccountNotFoundError, "Not Found (HTTP 404)"),
+            (500, CyberarkCCPError, "Internal Server Error (HTTP 500)"),
+            (502, CyberarkCCPError, "HTTP error 502: HTTP 502 Error"),
+        ],
+    )
+    def test_error_no_json_response(self, requests_mock, client, status, exception, expected):
+        """Test errors with non-JSON responses are classified by HTTP status."""
+        requests_mock.get(ACCOUNTS_URL, status_code=status, text=f"HTTP {status} Error")
+
+        with pytest.raises(exception, match=re.escape(expected)):
+            client.get_account(safe="TestSafe")
+
+    def test_unrecognised_error_code_falls_back_to_status(self, requests_mock, client):
+        """Test unknown error codes are classified by HTTP status."""
+        requests_mock.get(ACCOUNTS_URL, status_code=403, json={"ErrorCode": "APPAP999E", "ErrorMessage": "Unexpected"})
+
+        with pytest.raises(CyberarkCCPAuthorizationError, match=r"Authorization failed \(APPAP999E\): Unexpected"):
+            client.get_account(safe="TestSafe")
+
+    def test_unmapped_status_code(self, requests_mock, client):
+        """Test status codes outside the specification raise the base exception."""
+        requests_mock.get(ACCOUNTS_URL, status_code=502, json={"ErrorCode": "APPAP999E", "ErrorMessage": "Bad gateway"})
+
+        with pytest.raises(CyberarkCCPError, match=r"CCP API error 502 \(APPAP999E\): Bad gateway"):
+            client.get_account(safe="TestSafe")
+
+    def test_error_body_sniffing(self, requests_mock, client):
+        """Test only bodies that look like JSON objects are parsed, and malformed ones fall back to text."""
+        requests_mock.get(ACCOUNTS_URL, status_code=404, text="HTTP 404 Error")
+
+        with patch("cyberark_ccp.client._json_loads") as mock_loads:
+            with pytest.raises(CyberarkCCPAccountNotFoundError, match=r"Not Found \(HTTP 404\): HTTP 404 Error"):
+                client.get_account(safe="TestSafe")
+            mock_loads.assert_not_called()
+
+        requests_mock.get(
+            ACCOUNTS_URL, status_code=404, content=b'\n  {"ErrorCode": "APPAP004E", "ErrorMessage": "Safe not found"}'
         )
+        with pytest.raises(CyberarkCCPAccountNotFoundError, match=r"Safe not found \(APPAP004E\)"):
+            client.get_account(safe="TestSafe")
 
-        with pytest.raises(CyberarkCCPError) as exc_info:
-            self.client.get_account(safe="TestSafe")
-
-        assert "Password change in progress (APPAP282E)" in str(exc_info.value)
-
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_400_error_no_json_response(self, mock_get):
-        """Test 400 error with non-JSON response."""
-        mock_get.return_value = self.create_mock_error_response(400)
-
-        with pytest.raises(CyberarkCCPValidationError) as exc_info:
-            self.client.get_account(safe="TestSafe")
-
-        assert "Bad Request (HTTP 400)" in str(exc_info.value)
-
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_403_error_no_json_response(self, mock_get):
-        """Test 403 error with non-JSON response."""
-        mock_get.return_value = self.create_mock_error_response(403)
-
-        with pytest.raises(CyberarkCCPAuthenticationError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+        requests_mock.get(ACCOUNTS_URL, status_code=404, content=b"{truncated")
+        with pytest.raises(CyberarkCCPAccountNotFoundError, match=r"Not Found \(HTTP 404\): \{truncated"):
+            client.get_account(safe="TestSafe")
 
-        assert "Forbidden (HTTP 403)" in str(exc_info.value)
+    def test_non_utf8_error_body(self, requests_mock, client):
+        """Test undecodable bytes in a non-JSON error body are replaced rather than raising."""
+        requests_mock.get(ACCOUNTS_URL, status_code=404, content=b"Not found \xff")
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_404_error_no_json_response(self, mock_get):
-        """Test 404 error with non-JSON response."""
-        mock_get.return_value = self.create_mock_error_response(404)
+        with pytest.raises(CyberarkCCPAccountNotFoundError, match=r"Not Found \(HTTP 404\): Not found \ufffd"):
+            client.get_account(safe="TestSafe")
 
-        with pytest.raises(CyberarkCCPAccountNotFoundError) as exc_info:
-            self.client.get_account(safe="TestSafe")
-
-        assert "Not Found (HTTP 404)" in str(exc_info.value)
-
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_500_error_no_json_response(self, mock_get):
-        """Test 500 error with non-JSON response."""
-        mock_get.return_value = self.create_mock_error_response(500)
-
-        with pytest.raises(CyberarkCCPError) as exc_info:
-            self.client.get_account(safe="TestSafe")
-
-        assert "Internal Server Error (HTTP 500)" in str(exc_info.value)
-
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_timeout_error(self, mock_get):
+    def test_timeout_error(self, requests_mock, client):
         """Test timeout error handling."""
-        mock_get.side_effect = requests.exceptions.Timeout()
-
-        with pytest.raises(CyberarkCCPTimeoutError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+        requests_mock.get(ACCOUNTS_URL, exc=Timeout)
 
-        assert "Request timed out after 30 seconds" in str(exc_info.value)
+        with pytest.raises(CyberarkCCPTimeoutError, match="Request timed out after 30 seconds"):
+            client.get_account(safe="TestSafe")
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_connection_error(self, mock_get):
+    def test_connection_error(self, requests_mock, client):
         """Test connection error handling."""
-        mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
+        requests_mock.get(ACCOUNTS_URL, exc=RequestsConnectionError("Connection failed"))
 
-        with pytest.raises(CyberarkCCPConnectionError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+        with pytest.raises(CyberarkCCPConnectionError, match="Connection error"):
+            client.get_account(safe="TestSafe")
 
-        assert "Connection error" in str(exc_info.value)
-
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_generic_request_error(self, mock_get):
+    def test_generic_request_error(self, requests_mock, client):
         """Test generic request error handling."""
-        mock_get.side_effect = requests.exceptions.RequestException("Generic error")
-
-        with pytest.raises(CyberarkCCPError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+        requests_mock.get(ACCOUNTS_URL, exc=RequestException("Generic error"))
 
-        assert "Request failed" in str(exc_info.value)
+        with pytest.raises(CyberarkCCPError, match="Request failed"):
+            client.get_account(safe="TestSafe")
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_invalid_json_response(self, mock_get):
+    def test_invalid_json_response(self, requests_mock, client):
         """Test invalid JSON response handling."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-
-        with pytest.raises(CyberarkCCPError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+        requests_mock.get(ACCOUNTS_URL, content=b"not json")
 
-        assert "Invalid JSON response from server" in str(exc_info.value)
+        with pytest.raises(CyberarkCCPError, match="Invalid JSON response from server"):
+            client.get_account(safe="TestSafe")
 
 
 class TestQueryFormat:
@@ -484,9 +842,8 @@ class TestQueryFormat:
         assert QueryFormat.EXACT.value == "Exact"
         assert QueryFormat.REGEXP.value == "Regexp"
 
-    def test_query_format_usage(self):
+    def test_query_format_usage(self, client):
         """Test QueryFormat enum usage in client."""
-        client = CyberarkCCPClient("https://test.com", "TestApp")
 
         # Test with EXACT
         params = client._build_params(query="Safe=Test", query_format=QueryFormat.EXACT)
@@ -496,65 +853,46 @@ class TestQueryFormat:
         params = client._build_params(query="Safe=Test.*", query_format=QueryFormat.REGEXP)
         assert params["Query Format"] == "Regexp"
 
+    def test_query_format_is_string(self, client):
+        """Test QueryFormat members behave as their wire values and raw strings are accepted."""
+
+        assert isinstance(QueryFormat.REGEXP, str)
+        assert str(QueryFormat.REGEXP) == "Regexp"
+        assert f"{QueryFormat.EXACT}" == "Exact"
+        assert QueryFormat("Regexp") is QueryFormat.REGEXP
+
+        params = client._build_params(query="Safe=Test.*", query_format="Regexp")
+        assert params["Query Format"] == "Regexp"
+
 
 class TestAPISpecificationCompliance:
     """Test suite to verify compliance with API specification."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.client = CyberarkCCPClient("https://test.com", "TestApp")
-
-    def test_url_construction(self):
-        """Test URL construction matches API specification."""
-        with patch("cyberark_ccp.client.requests.Session.get") as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"Content": "test"}
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
-
-            self.client.get_account(safe="TestSafe")
-
-            # Verify URL matches specification
-            call_args = mock_get.call_args
-            url = call_args[0][0]
-            assert url == "https://test.com/AIMWebService/api/Accounts"
-
-    def test_http_method_and_version(self):
-        """Test HTTP method is GET as per specification."""
-        with patch("cyberark_ccp.client.requests.Session.get") as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"Content": "test"}
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
-
-            self.client.get_account(safe="TestSafe")
-
-            # Verify GET method was used
-            mock_get.assert_called_once()
-
-    def test_content_type_expectation(self):
-        """Test that we expect application/json content type."""
-        # The client expects JSON responses, which is tested through json() calls
-        # This is implicitly tested in other tests, but we can verify the expectation
-        with patch("cyberark_ccp.client.requests.Session.get") as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"Content": "test"}
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
-
-            result = self.client.get_account(safe="TestSafe")
-
-            # Verify we successfully parse JSON response
-            assert isinstance(result, dict)
-            mock_response.json.assert_called_once()
-
-    def test_parameter_name_compliance(self):
+    @pytest.fixture(autouse=True)
+    def _mock_accounts(self, requests_mock):
+        """Serve a successful Accounts response; tests register their own response where it matters."""
+        requests_mock.get(ACCOUNTS_URL, json={"Content": "test"})
+        self.requests_mock = requests_mock
+
+    def test_request_shape(self, client):
+        """Test the request URL, method and response decoding match the API specification."""
+        # The client decodes the raw JSON body itself rather than going through Response.json()
+        with patch.object(requests.Response, "json") as mock_json:
+            result = client.get_account(safe="TestSafe")
+
+        # Verify a single GET to the Accounts endpoint
+        assert self.requests_mock.call_count == 1
+        assert self.requests_mock.last_request.method == "GET"
+        assert self.requests_mock.last_request.url == ACCOUNTS_URL + "?AppID=TestApp&Safe=TestSafe"
+
+        # Verify we successfully parse JSON response
+        assert result == {"Content": "test"}
+        mock_json.assert_not_called()
+
+    def test_parameter_name_compliance(self, client):
         """Test that parameter names match API specification exactly."""
         # Test standard parameters (without Query to avoid override)
-        params = self.client._build_params(
+        params = client._build_params(
             safe="Safe",
             folder="Folder",
             password_object="Object",
@@ -581,87 +919,73 @@ class TestAPISpecificationCompliance:
         assert "FailRequestOnPasswordChange" in params
 
         # Test Query parameters separately (since Query overrides others)
-        query_params = self.client._build_params(query="TestQuery", query_format=QueryFormat.EXACT, reason="TestReason")
+        query_params = client._build_params(query="TestQuery", query_format=QueryFormat.EXACT, reason="TestReason")
         assert "Query" in query_params
         assert "Query Format" in query_params  # Note: with space as per spec
 
-    def test_response_structure_compliance(self):
+    def test_response_structure_compliance(self, client):
         """Test response structure matches API specification."""
-        with patch("cyberark_ccp.client.requests.Session.get") as mock_get:
-            # Mock response matching API specification
-            api_response = {
-                "Content": "test-password",
-                "UserName": "test-user",
-                "Address": "test.example.com",
-                "Database": "test-db",
-                "PasswordChangeInProcess": False,
-            }
-
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = api_response
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
-
-            result = self.client.get_account(safe="TestSafe")
-
-            # Verify all expected fields from specification
-            assert "Content" in result
-            assert "UserName" in result
-            assert "Address" in result
-            assert "Database" in result
-            assert "PasswordChangeInProcess" in result
-
-            # Verify data types match specification
-            assert isinstance(result["Content"], str)
-            assert isinstance(result["UserName"], str)
-            assert isinstance(result["Address"], str)
-            assert isinstance(result["Database"], str)
-            assert isinstance(result["PasswordChangeInProcess"], bool)
-
-    def test_character_restrictions_compliance(self):
+        # Mock response matching API specification
+        self.requests_mock.get(ACCOUNTS_URL, content=ACCOUNT_RESPONSE.content)
+
+        result = client.get_account(safe="TestSafe")
+
+        # Verify all expected fields from specification
+        assert "Content" in result
+        assert "UserName" in result
+        assert "Address" in result
+        assert "Database" in result
+        assert "PasswordChangeInProcess" in result
+
+        # Verify data types match specification
+        assert isinstance(result["Content"], str)
+        assert isinstance(result["UserName"], str)
+        assert isinstance(result["Address"], str)
+        assert isinstance(result["Database"], str)
+        assert isinstance(result["PasswordChangeInProcess"], bool)
+
+    # Test all restricted characters from specification, plus the space restriction
+    @pytest.mark.parametrize("value", [f"test{char}value" for char in INVALID_URL_CHARS] + ["test value"])
+    def test_character_restrictions_compliance(self, client, value):
         """Test character restrictions match API specification exactly."""
-        # Test all restricted characters from specification: +, &, %, ;
-        restricted_chars = ["+", "&", "%", ";"]
-
-        for char in restricted_chars:
-            with pytest.raises(CyberarkCCPValidationError):
-                self.client._validate_url_value(f"test{char}value", "TestParam")
-
-        # Test space restriction
         with pytest.raises(CyberarkCCPValidationError):
-            self.client._validate_url_value("test value", "TestParam")
+            client._validate_url_value(value, "TestParam")
 
-    def test_required_parameter_compliance(self):
+    def test_required_parameter_compliance(self, client):
         """Test AppID + at least one other parameter requirement."""
         # This should fail per specification
         with pytest.raises(CyberarkCCPValidationError, match="AppID and at least one other parameter"):
-            self.client.get_account()
-
-        # These should work (AppID + one other parameter)
-        valid_combinations = [
-            {"safe": "TestSafe"},
-            {"folder": "TestFolder"},
-            {"password_object": "TestObject"},
-            {"username": "TestUser"},
-            {"address": "TestAddress"},
-            {"database": "TestDB"},
-            {"policy_id": "TestPolicy"},
-            {"query": "TestQuery"},
-        ]
-
-        for combo in valid_combinations:
-            # Should not raise validation error (will raise connection error due to mocking)
-            try:
-                self.client._build_params(**combo)
-            except CyberarkCCPValidationError as e:
-                if "AppID and at least one other parameter" in str(e):
-                    pytest.fail(f"Valid combination {combo} incorrectly rejected")
-
-    def test_query_parameter_behavior_compliance(self):
+            client.get_account()
+
+    @pytest.mark.parametrize(
+        "combo, query_string",
+        [
+            ({"safe": "TestSafe"}, "Safe=TestSafe"),
+            ({"password_object": "TestObject"}, "Object=TestObject"),
+            ({"username": "TestUser"}, "UserName=TestUser"),
+            ({"address": "TestAddress"}, "Address=TestAddress"),
+            ({"database": "TestDB"}, "Database=TestDB"),
+            ({"policy_id": "TestPolicy"}, "PolicyID=TestPolicy"),
+            ({"query": "TestQuery"}, "Query=TestQuery"),
+        ],
+    )
+    def test_single_search_parameter_accepted(self, client, combo, query_string):
+        """Test get_account accepts AppID plus any single search parameter and sends just those two."""
+        client.get_account(**combo)
+
+        assert self.requests_mock.last_request.url == f"{ACCOUNTS_URL}?AppID=TestApp&{query_string}"
+
+    def test_folder_alone_is_not_a_search_parameter(self, client):
+        """Test Folder only narrows a search, so it does not satisfy the AppID + one parameter rule."""
+        with pytest.raises(CyberarkCCPValidationError, match="AppID and at least one other parameter"):
+            client.get_account(folder="TestFolder")
+
+        assert self.requests_mock.call_count == 0
+
+    def test_query_parameter_behavior_compliance(self, client):
         """Test Query parameter behavior per API specification."""
         # When Query is specified, other search criteria should be ignored
-        params = self.client._build_params(
+        params = client._build_params(
             query="Safe=TestSafe",
             safe="IgnoredSafe",
             folder="IgnoredFolder",
@@ -682,18 +1006,18 @@ class TestAPISpecificationCompliance:
         assert "Database" not in params
         assert "PolicyID" not in params
 
-    def test_default_values_compliance(self):
+    def test_default_values_compliance(self, client):
         """Test default values match API specification."""
         # Query Format default should be "Exact" if not specified
-        params = self.client._build_params(query="Safe=Test")
+        params = client._build_params(query="Safe=Test")
         # When query_format is not specified, "Query Format" should not be in params
         # The default is handled by the API server, not the client
         assert "Query Format" not in params
 
         # Connection Timeout default is 30 (handled by server)
-        params = self.client._build_params(safe="TestSafe")
+        params = client._build_params(safe="TestSafe")
         assert "Connection Timeout" not in params
 
         # FailRequestOnPasswordChange default is False (handled by server)
-        params = self.client._build_params(safe="TestSafe")
+        params = client._build_params(safe="TestSafe")
         assert "FailRequestOnPasswordChange" not in params
@@ -12,57 +12,92 @@ from cyberark_ccp import (
     CyberarkCCPValidationError,
 )
 
+from ._error_codes import API_ERROR_CODES
 
+# The base exception first, followed by every subclass
+ALL_EXCEPTIONS = (
+    CyberarkCCPError,
+    CyberarkCCPValidationError,
+    CyberarkCCPAuthenticationError,
+    CyberarkCCPAuthorizationError,
+    CyberarkCCPAccountNotFoundError,
+    CyberarkCCPConnectionError,
+    CyberarkCCPTimeoutError,
+)
+
+# Explicit parametrize IDs: readable in test names (-k CyberarkCCPTimeoutError) and cheaper to collect
+ALL_EXCEPTION_IDS = tuple(exc.__name__ for exc in ALL_EXCEPTIONS)
+
+# Messages representing actual scenarios for each exception type
+VALIDATION_SCENARIOS = (
+    "Invalid query format",
+    "Request message content is invalid",
+    "Invalid characters in User Name",
+    "Invalid request. The AppID parameter is required",
+    "Parameter 'test' contains invalid character '+'",
+)
+AUTHENTICATION_SCENARIOS = (
+    "App failed on authentication check",
+    "Authentication failed (APPAP306E)",
+    "Certificate authentication failed",
+)
+AUTHORIZATION_SCENARIOS = ("User not defined", "ITATS982E User app11 is not defined", "Insufficient permissions")
+NOT_FOUND_SCENARIOS = ("Too many objects", "Safe not found", "Account not found", "Resource not found")
+CONNECTION_SCENARIOS = (
+    "Connection to the Vault has failed",
+    "Connection error: HTTPSConnectionPool",
+    "Network unreachable",
+)
+TIMEOUT_SCENARIOS = ("Request timed out after 30 seconds", "Connection timeout", "Read timeout")
+
+
+@pytest.mark.xdist_group("ccp_fast")
 class TestExceptionHierarchy:
     """Test suite for exception hierarchy."""
 
-    def test_base_exception_inheritance(self):
+    @pytest.mark.parametrize("exc_class", ALL_EXCEPTIONS[1:], ids=ALL_EXCEPTION_IDS[1:])
+    def test_base_exception_inheritance(self, exc_class):
         """Test that all CCP exceptions inherit from CyberarkCCPError."""
-        assert issubclass(CyberarkCCPValidationError, CyberarkCCPError)
-        assert issubclass(CyberarkCCPAuthenticationError, CyberarkCCPError)
-        assert issubclass(CyberarkCCPAuthorizationError, CyberarkCCPError)
-        assert issubclass(CyberarkCCPAccountNotFoundError, CyberarkCCPError)
-        assert issubclass(CyberarkCCPConnectionError, CyberarkCCPError)
-        assert issubclass(CyberarkCCPTimeoutError, CyberarkCCPError)
+        assert issubclass(exc_class, CyberarkCCPError)
 
     def test_base_exception_is_exception(self):
         """Test that CyberarkCCPError inherits from Exception."""
         assert issubclass(CyberarkCCPError, Exception)
 
-    def test_exception_instantiation(self):
+    @pytest.mark.parametrize("exc_class", ALL_EXCEPTIONS, ids=ALL_EXCEPTION_IDS)
+    def test_exception_instantiation(self, exc_class):
         """Test that all exceptions can be instantiated."""
-        exceptions = [
-            CyberarkCCPError,
-            CyberarkCCPValidationError,
-            CyberarkCCPAuthenticationError,
-            CyberarkCCPAuthorizationError,
-            CyberarkCCPAccountNotFoundError,
-            CyberarkCCPConnectionError,
-            CyberarkCCPTimeoutError,
-        ]
-
-        for exc_class in exceptions:
-            # Test with message
-            exc = exc_class("Test message")
-            assert str(exc) == "Test message"
-
-            # Test without message
-            exc = exc_class()
-            assert isinstance(exc, exc_class)
-
-    def test_exception_raising_and_catching(self):
-        """Test that exceptions can be raised and caught properly."""
-        # Test specific exception catching
-        with pytest.raises(CyberarkCCPValidationError):
-            raise CyberarkCCPValidationError("Validation failed")
-
-        # Test base exception catching
-        with pytest.raises(CyberarkCCPError):
-            raise CyberarkCCPValidationError("Validation failed")
-
-        # Test Exception base class catching
-        with pytest.raises(Exception):
-            raise CyberarkCCPError("Base error")
+        # Test with message
+        exc = exc_class("Test message")
+        assert str(exc) == "Test message"
+
+        # Test without message
+        exc = exc_class()
+        assert isinstance(exc, exc_class)
+
+    @pytest.mark.parametrize(
+        "raised, catch_as",
+        [
+            (CyberarkCCPValidationError, CyberarkCCPValidationError),
+            (CyberarkCCPValidationError, CyberarkCCPError),
+            (CyberarkCCPValidationError, Exception),
+            (CyberarkCCPError, CyberarkCCPError),
+            (CyberarkCCPError, Exception),
+        ],
+        ids=[
+            "CyberarkCCPValidationError-as-CyberarkCCPValidationError",
+            "CyberarkCCPValidationError-as-CyberarkCCPError",
+            "CyberarkCCPValidationError-as-Exception",
+            "CyberarkCCPError-as-CyberarkCCPError",
+            "CyberarkCCPError-as-Exception",
+        ],
+    )
+    def test_exception_raising_and_catching(self, raised, catch_as):
+        """Test that a raised exception can be caught as itself and as each of its base classes."""
+        with pytest.raises(catch_as) as exc_info:
+            raise raised("Error raised for catching")
+
+        assert type(exc_info.value) is raised
 
     def test_exception_chaining(self):
         """Test exception chaining with 'from' clause."""
@@ -76,119 +111,57 @@ class TestExceptionHierarchy:
 
         assert exc_info.value.__cause__ is original_error
 
-    def test_exception_messages(self):
+    @pytest.mark.parametrize("exc_class", ALL_EXCEPTIONS, ids=ALL_EXCEPTION_IDS)
+    def test_exception_messages(self, exc_class):
         """Test that exception messages are properly handled."""
         message = "Detailed error message"
 
-        exceptions = [
-            CyberarkCCPError(message),
-            CyberarkCCPValidationError(message),
-            CyberarkCCPAuthenticationError(message),
-            CyberarkCCPAuthorizationError(message),
-            CyberarkCCPAccountNotFoundError(message),
-            CyberarkCCPConnectionError(message),
-            CyberarkCCPTimeoutError(message),
-        ]
-
-        for exc in exceptions:
-            assert str(exc) == message
+        assert str(exc_class(message)) == message
 
 
 class TestExceptionUseCases:
     """Test suite for exception use cases based on API specification."""
 
-    def test_validation_error_scenarios(self):
+    @pytest.mark.parametrize("message", VALIDATION_SCENARIOS)
+    def test_validation_error_scenarios(self, message):
         """Test scenarios where CyberarkCCPValidationError should be used."""
-        # These represent actual validation scenarios
-        validation_scenarios = [
-            "Invalid query format",
-            "Request message content is invalid",
-            "Invalid characters in User Name",
-            "Invalid request. The AppID parameter is required",
-            "Parameter 'test' contains invalid character '+'",
-        ]
-
-        for message in validation_scenarios:
-            with pytest.raises(CyberarkCCPValidationError):
-                raise CyberarkCCPValidationError(message)
-
-    def test_authentication_error_scenarios(self):
+        with pytest.raises(CyberarkCCPValidationError):
+            raise CyberarkCCPValidationError(message)
+
+    @pytest.mark.parametrize("message", AUTHENTICATION_SCENARIOS)
+    def test_authentication_error_scenarios(self, message):
         """Test scenarios where CyberarkCCPAuthenticationError should be used."""
-        # These represent actual authentication scenarios
-        auth_scenarios = [
-            "App failed on authentication check",
-            "Authentication failed (APPAP306E)",
-            "Certificate authentication failed",
-        ]
-
-        for message in auth_scenarios:
-            with pytest.raises(CyberarkCCPAuthenticationError):
-                raise CyberarkCCPAuthenticationError(message)
-
-    def test_authorization_error_scenarios(self):
-        """Test scenarios where CyberarkCCPAuthorizationError should be used."""
-        # These represent actual authorization scenarios
-        auth_scenarios = ["User not defined", "ITATS982E User app11 is not defined", "Insufficient permissions"]
+        with pytest.raises(CyberarkCCPAuthenticationError):
+            raise CyberarkCCPAuthenticationError(message)
 
-        for message in auth_scenarios:
-            with pytest.raises(CyberarkCCPAuthorizationError):
-                raise CyberarkCCPAuthorizationError(message)
+    @pytest.mark.parametrize("message", AUTHORIZATION_SCENARIOS)
+    def test_authorization_error_scenarios(self, message):
+        """Test scenarios where CyberarkCCPAuthorizationError should be used."""
+        with pytest.raises(CyberarkCCPAuthorizationError):
+            raise CyberarkCCPAuthorizationError(message)
 
-    def test_account_not_found_error_scenarios(self):
+    @pytest.mark.parametrize("message", NOT_FOUND_SCENARIOS)
+    def test_account_not_found_error_scenarios(self, message):
         """Test scenarios where CyberarkCCPAccountNotFoundError should be used."""
-        # These represent actual account not found scenarios
-        not_found_scenarios = ["Too many objects", "Safe not found", "Account not found", "Resource not found"]
-
-        for message in not_found_scenarios:
-            with pytest.raises(CyberarkCCPAccountNotFoundError):
-                raise CyberarkCCPAccountNotFoundError(message)
+        with pytest.raises(CyberarkCCPAccountNotFoundError):
+            raise CyberarkCCPAccountNotFoundError(message)
 
-    def test_connection_error_scenarios(self):
+    @pytest.mark.parametrize("message", CONNECTION_SCENARIOS)
+    def test_connection_error_scenarios(self, message):
         """Test scenarios where CyberarkCCPConnectionError should be used."""
-        # These represent actual connection scenarios
-        connection_scenarios = [
-            "Connection to the Vault has failed",
-            "Connection error: HTTPSConnectionPool",
-            "Network unreachable",
-        ]
-
-        for message in connection_scenarios:
-            with pytest.raises(CyberarkCCPConnectionError):
-                raise CyberarkCCPConnectionError(message)
-
-    def test_timeout_error_scenarios(self):
-        """Test scenarios where CyberarkCCPTimeoutError should be used."""
-        # These represent actual timeout scenarios
-        timeout_scenarios = ["Request timed out after 30 seconds", "Connection timeout", "Read timeout"]
+        with pytest.raises(CyberarkCCPConnectionError):
+            raise CyberarkCCPConnectionError(message)
 
-        for message in timeout_scenarios:
-            with pytest.raises(CyberarkCCPTimeoutError):
-                raise CyberarkCCPTimeoutError(message)
+    @pytest.mark.parametrize("message", TIMEOUT_SCENARIOS)
+    def test_timeout_error_scenarios(self, message):
+        """Test scenarios where CyberarkCCPTimeoutError should be used."""
+        with pytest.raises(CyberarkCCPTimeoutError):
+            raise CyberarkCCPTimeoutError(message)
 
-    def test_error_code_mapping_scenarios(self):
+    @pytest.mark.parametrize("error_code,expected_exception", list(API_ERROR_CODES.items()), ids=list(API_ERROR_CODES))
+    def test_error_code_mapping_scenarios(self, error_code, expected_exception):
         """Test that error codes map to appropriate exception types."""
-        # Based on API specification error code mappings
-        error_mappings = {
-            # 400 errors
-            "AIMWS030E": CyberarkCCPValidationError,
-            "APPAP227E": CyberarkCCPAccountNotFoundError,
-            "APPAP228E": CyberarkCCPAccountNotFoundError,
-            "APPAP229E": CyberarkCCPAccountNotFoundError,
-            "APPAP007E": CyberarkCCPConnectionError,
-            "APPAP081E": CyberarkCCPValidationError,
-            "CASVL010E": CyberarkCCPValidationError,
-            "AIMWS031E": CyberarkCCPValidationError,
-            # 403 errors
-            "APPAP306E": CyberarkCCPAuthenticationError,
-            "APPAP008E": CyberarkCCPAuthorizationError,
-            # 404 errors
-            "APPAP004E": CyberarkCCPAccountNotFoundError,
-            # 500 errors
-            "APPAP282E": CyberarkCCPError,
-        }
-
-        for error_code, expected_exception in error_mappings.items():
-            message = f"Error with code {error_code}"
-
-            with pytest.raises(expected_exception):
-                raise expected_exception(message)
+        message = f"Error with code {error_code}"
+
+        with pytest.raises(expected_exception):
+            raise expected_exception(message)
@@ -1,9 +1,11 @@
 """Integration tests for CyberArk CCP API client."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
-import requests
+from requests import Session
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
 
 from cyberark_ccp import (
     CyberarkCCPAccountNotFoundError,
@@ -16,34 +18,41 @@ from cyberark_ccp import (
     QueryFormat,
 )
 
+from .conftest import FakeResponse
 
+# Deselected by the default addopts; run with `pytest -m integration` (tox and CI run everything)
+pytestmark = pytest.mark.integration
+
+
+# Clients are stateless between calls (no cache), so each is built once per module.
+# The basic `client` fixture is shared from conftest.py.
+@pytest.fixture(scope="module")
+def scenario_client():
+    """Provide a shared client configured like a typical application deployment."""
+    client = CyberarkCCPClient(base_url="https://ccp.example.com", app_id="MyApplication", verify=True, timeout=30)
+    yield client
+    client.close()
+
+
+@pytest.mark.xdist_group("ccp_integration")
 class TestRealWorldScenarios:
     """Test suite for real-world usage scenarios."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.client = CyberarkCCPClient(
-            base_url="https://ccp.example.com", app_id="MyApplication", verify=True, timeout=30
-        )
-
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_database_credential_retrieval(self, mock_get):
+    def test_database_credential_retrieval(self, mock_get, scenario_client):
         """Test retrieving database credentials with multiple search criteria."""
         # Mock successful database credential response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "Content": "DatabasePassword123!",
-            "UserName": "db_service_user",
-            "Address": "database.example.com",
-            "Database": "production_db",
-            "PasswordChangeInProcess": False,
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = FakeResponse.from_json(
+            {
+                "Content": "DatabasePassword123!",
+                "UserName": "db_service_user",
+                "Address": "database.example.com",
+                "Database": "production_db",
+                "PasswordChangeInProcess": False,
+            }
+        )
 
         # Retrieve database credentials
-        account_info = self.client.get_account(
+        account_info = scenario_client.get_account(
             safe="DatabaseCredentials",
             username="db_service_user",
             address="database.example.com",
@@ -55,12 +64,17 @@ class TestRealWorldScenarios:
         call_args = mock_get.call_args
         params = call_args[1]["params"]
 
-        assert params["AppID"] == "MyApplication"
-        assert params["Safe"] == "DatabaseCredentials"
-        assert params["UserName"] == "db_service_user"
-        assert params["Address"] == "database.example.com"
-        assert params["Database"] == "production_db"
-        assert params["Reason"] == "ApplicationStartup"
+        expected_params = {
+            "AppID": "MyApplication",
+            "Safe": "DatabaseCredentials",
+            "UserName": "db_service_user",
+            "Address": "database.example.com",
+            "Database": "production_db",
+            "Reason": "ApplicationStartup",
+        }
+        assert (
+            expected_params.items() <= params.items()
+        ), f"Missing/wrong params: {expected_params.items() - params.items()}"
 
         # Verify response
         assert account_info["Content"] == "DatabasePassword123!"
@@ -69,21 +83,18 @@ class TestRealWorldScenarios:
         assert account_info["Database"] == "production_db"
         assert account_info["PasswordChangeInProcess"] is False
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_web_service_credential_retrieval(self, mock_get):
+    def test_web_service_credential_retrieval(self, mock_get, scenario_client):
         """Test retrieving web service credentials using object name."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "Content": "WebServiceAPIKey789",
-            "UserName": "api_service",
-            "Address": "api.example.com",
-            "PasswordChangeInProcess": False,
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = FakeResponse.from_json(
+            {
+                "Content": "WebServiceAPIKey789",
+                "UserName": "api_service",
+                "Address": "api.example.com",
+                "PasswordChangeInProcess": False,
+            }
+        )
 
-        password = self.client.get_password(
+        password = scenario_client.get_password(
             safe="WebServiceCredentials", password_object="APIService_Key", reason="APIIntegration"
         )
 
@@ -91,29 +102,27 @@ class TestRealWorldScenarios:
         call_args = mock_get.call_args
         params = call_args[1]["params"]
 
-        assert params["Safe"] == "WebServiceCredentials"
-        assert params["Object"] == "APIService_Key"
-        assert params["Reason"] == "APIIntegration"
+        expected_params = {"Safe": "WebServiceCredentials", "Object": "APIService_Key", "Reason": "APIIntegration"}
+        assert (
+            expected_params.items() <= params.items()
+        ), f"Missing/wrong params: {expected_params.items() - params.items()}"
 
         # Verify password is extracted correctly
         assert password == "WebServiceAPIKey789"
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_advanced_query_with_regex(self, mock_get):
+    def test_advanced_query_with_regex(self, mock_get, scenario_client):
         """Test advanced query using regular expressions."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "Content": "ProdDBPassword456",
-            "UserName": "prod_service",
-            "Address": "prod-db-01.example.com",
-            "Database": "prod_main",
-            "PasswordChangeInProcess": False,
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = FakeResponse.from_json(
+            {
+                "Content": "ProdDBPassword456",
+                "UserName": "prod_service",
+                "Address": "prod-db-01.example.com",
+                "Database": "prod_main",
+                "PasswordChangeInProcess": False,
+            }
+        )
 
-        account_info = self.client.get_account(
+        account_info = scenario_client.get_account(
             query="Safe=Production,Address=prod-db-.*,Database=prod_.*",
             query_format=QueryFormat.REGEXP,
             connection_timeout=60,
@@ -124,10 +133,15 @@ class TestRealWorldScenarios:
         call_args = mock_get.call_args
         params = call_args[1]["params"]
 
-        assert params["Query"] == "Safe=Production,Address=prod-db-.*,Database=prod_.*"
-        assert params["Query Format"] == "Regexp"
-        assert params["Connection Timeout"] == "60"
-        assert params["Reason"] == "ProductionDatabaseMaintenance"
+        expected_params = {
+            "Query": "Safe=Production,Address=prod-db-.*,Database=prod_.*",
+            "Query Format": "Regexp",
+            "Connection Timeout": "60",
+            "Reason": "ProductionDatabaseMaintenance",
+        }
+        assert (
+            expected_params.items() <= params.items()
+        ), f"Missing/wrong params: {expected_params.items() - params.items()}"
 
         # Verify other search parameters are not included (ignored when Query is used)
         assert "Safe" not in params
@@ -136,7 +150,6 @@ class TestRealWorldScenarios:
 
         assert account_info["Content"] == "ProdDBPassword456"
 
-    @patch("cyberark_ccp.client.requests.Session.get")
     def test_certificate_based_authentication(self, mock_get):
         """Test certificate-based authentication workflow."""
         # Create client with certificate
@@ -148,15 +161,13 @@ class TestRealWorldScenarios:
             timeout=45,
         )
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "Content": "SecurePassword999",
-            "UserName": "secure_service",
-            "PasswordChangeInProcess": False,
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = FakeResponse.from_json(
+            {
+                "Content": "SecurePassword999",
+                "UserName": "secure_service",
+                "PasswordChangeInProcess": False,
+            }
+        )
 
         password = cert_client.get_password(
             safe="HighSecuritySafe",
@@ -177,197 +188,153 @@ class TestRealWorldScenarios:
 
         assert password == "SecurePassword999"
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_password_change_in_progress_scenario(self, mock_get):
+    def test_password_change_in_progress_scenario(self, mock_get, scenario_client):
         """Test handling of password change in progress."""
         # First request fails due to password change
-        mock_response_error = Mock()
-        mock_response_error.status_code = 500
-        mock_response_error.json.return_value = {
-            "ErrorCode": "APPAP282E",
-            "ErrorMessage": "Password [TestPassword] is currently being changed by the CPM.",
-        }
-        mock_response_error.raise_for_status.side_effect = requests.exceptions.HTTPError()
+        mock_response_error = FakeResponse.from_json(
+            {
+                "ErrorCode": "APPAP282E",
+                "ErrorMessage": "Password [TestPassword] is currently being changed by the CPM.",
+            },
+            status_code=500,
+        )
 
         # Second request with fail_request_on_password_change=False should succeed
-        mock_response_success = Mock()
-        mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {"Content": "NewPassword123", "PasswordChangeInProcess": True}
-        mock_response_success.raise_for_status.return_value = None
+        mock_response_success = FakeResponse(content=b'{"Content": "NewPassword123", "PasswordChangeInProcess": true}')
 
         mock_get.side_effect = [mock_response_error, mock_response_success]
 
         # First request should fail
         with pytest.raises(CyberarkCCPError, match="Password change in progress"):
-            self.client.get_password(
+            scenario_client.get_password(
                 safe="TestSafe", password_object="TestObject", fail_request_on_password_change=True
             )
 
         # Second request should succeed
-        password = self.client.get_password(
+        password = scenario_client.get_password(
             safe="TestSafe", password_object="TestObject", fail_request_on_password_change=False
         )
 
         assert password == "NewPassword123"
 
-    def test_context_manager_usage(self):
+    def test_context_manager_usage(self, monkeypatch):
         """Test using client as context manager."""
-        with patch.object(CyberarkCCPClient, "close") as mock_close:
-            with CyberarkCCPClient("https://test.com", "TestApp") as client:
-                assert isinstance(client, CyberarkCCPClient)
-                # Context manager should ensure cleanup
+        closed = []
+        monkeypatch.setattr(CyberarkCCPClient, "close", lambda self: closed.append(self))
+
+        with CyberarkCCPClient("https://test.com", "TestApp") as client:
+            assert isinstance(client, CyberarkCCPClient)
 
-            mock_close.assert_called_once()
+        # Context manager should ensure cleanup
+        assert closed == [client]
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_multiple_requests_session_reuse(self, mock_get):
+    def test_multiple_requests_session_reuse(self, scenario_client):
         """Test that session is reused across multiple requests."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"Content": "password"}
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        # autospec passes the Session instance through, so each call records which session made it
+        with patch.object(Session, "get", autospec=True) as mock_get:
+            mock_get.return_value = FakeResponse(content=b'{"Content": "password"}')
 
-        # Make multiple requests
-        self.client.get_password(safe="Safe1", password_object="Object1")
-        self.client.get_password(safe="Safe2", password_object="Object2")
-        self.client.get_password(safe="Safe3", password_object="Object3")
+            # Make multiple requests
+            scenario_client.get_password(safe="Safe1", password_object="Object1")
+            scenario_client.get_password(safe="Safe2", password_object="Object2")
+            scenario_client.get_password(safe="Safe3", password_object="Object3")
 
         # Verify session was reused (same session object for all calls)
         assert mock_get.call_count == 3
+        assert all(call.args[0] is scenario_client._session for call in mock_get.call_args_list)
 
-        # All calls should use the same session instance
-        for call in mock_get.call_args_list:
-            # This verifies the session object is consistent
-            pass  # Session reuse is implicit in the mock setup
-
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_error_recovery_workflow(self, mock_get):
+    def test_error_recovery_workflow(self, mock_get, scenario_client):
         """Test error recovery and retry scenarios."""
         # First request times out
         mock_get.side_effect = [
-            requests.exceptions.Timeout(),
+            Timeout(),
             # Second request succeeds
-            Mock(
-                status_code=200,
-                json=Mock(return_value={"Content": "RecoveredPassword"}),
-                raise_for_status=Mock(return_value=None),
-            ),
+            FakeResponse(content=b'{"Content": "RecoveredPassword"}'),
         ]
 
         # First request should fail with timeout
         with pytest.raises(CyberarkCCPTimeoutError):
-            self.client.get_password(safe="TestSafe", password_object="TestObject")
+            scenario_client.get_password(safe="TestSafe", password_object="TestObject")
 
         # Second request should succeed
-        password = self.client.get_password(safe="TestSafe", password_object="TestObject")
+        password = scenario_client.get_password(safe="TestSafe", password_object="TestObject")
         assert password == "RecoveredPassword"
 
 
+@pytest.mark.xdist_group("ccp_integration")
 class TestErrorScenarios:
     """Test suite for various error scenarios."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.client = CyberarkCCPClient("https://test.com", "TestApp")
-
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_authentication_failure_workflow(self, mock_get):
+    def test_authentication_failure_workflow(self, mock_get, client):
         """Test complete authentication failure workflow."""
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_response.json.return_value = {
-            "ErrorCode": "APPAP306E",
-            "ErrorMessage": "App failed on authentication check.",
-        }
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-        mock_get.return_value = mock_response
-
-        with pytest.raises(CyberarkCCPAuthenticationError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+        mock_get.return_value = FakeResponse.from_json(
+            {
+                "ErrorCode": "APPAP306E",
+                "ErrorMessage": "App failed on authentication check.",
+            },
+            status_code=403,
+        )
 
-        assert "Authentication failed (APPAP306E)" in str(exc_info.value)
-        assert "App failed on authentication check" in str(exc_info.value)
+        with pytest.raises(
+            CyberarkCCPAuthenticationError,
+            match=r"Authentication failed \(APPAP306E\): App failed on authentication check",
+        ):
+            client.get_account(safe="TestSafe")
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_account_not_found_workflow(self, mock_get):
+    def test_account_not_found_workflow(self, mock_get, client):
         """Test account not found error workflow."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.json.return_value = {"ErrorCode": "APPAP004E", "ErrorMessage": "Safe not found"}
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-        mock_get.return_value = mock_response
-
-        with pytest.raises(CyberarkCCPAccountNotFoundError) as exc_info:
-            self.client.get_account(safe="NonExistentSafe")
+        mock_get.return_value = FakeResponse.from_json(
+            {"ErrorCode": "APPAP004E", "ErrorMessage": "Safe not found"}, status_code=404
+        )
 
-        assert "Safe not found (APPAP004E)" in str(exc_info.value)
+        with pytest.raises(CyberarkCCPAccountNotFoundError, match=r"Safe not found \(APPAP004E\)"):
+            client.get_account(safe="NonExistentSafe")
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_validation_error_workflow(self, mock_get):
+    def test_validation_error_workflow(self, mock_get, client):
         """Test validation error workflow."""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {
-            "ErrorCode": "AIMWS031E",
-            "ErrorMessage": "Invalid request. The AppID parameter is required.",
-        }
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-        mock_get.return_value = mock_response
-
-        with pytest.raises(CyberarkCCPValidationError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+        mock_get.return_value = FakeResponse.from_json(
+            {
+                "ErrorCode": "AIMWS031E",
+                "ErrorMessage": "Invalid request. The AppID parameter is required.",
+            },
+            status_code=400,
+        )
 
-        assert "Request validation error (AIMWS031E)" in str(exc_info.value)
+        with pytest.raises(CyberarkCCPValidationError, match=r"Request validation error \(AIMWS031E\)"):
+            client.get_account(safe="TestSafe")
 
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_network_error_workflow(self, mock_get):
+    def test_network_error_workflow(self, mock_get, client):
         """Test network error workflow."""
-        mock_get.side_effect = requests.exceptions.ConnectionError("Connection refused")
-
-        with pytest.raises(CyberarkCCPConnectionError) as exc_info:
-            self.client.get_account(safe="TestSafe")
+        mock_get.side_effect = RequestsConnectionError("Connection refused")
 
-        assert "Connection error" in str(exc_info.value)
-        assert "Connection refused" in str(exc_info.value)
+        with pytest.raises(CyberarkCCPConnectionError, match="Connection error: Connection refused"):
+            client.get_account(safe="TestSafe")
 
 
 class TestParameterValidationIntegration:
     """Test suite for integrated parameter validation scenarios."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.client = CyberarkCCPClient("https://test.com", "TestApp")
-
-    def test_comprehensive_parameter_validation(self):
+    # Test various invalid character combinations; the error names the specific character
+    @pytest.mark.parametrize(
+        "invalid_value,pattern",
+        [
+            ("test+value", r"'\+'.*are not supported"),
+            ("test&value", "'&'.*are not supported"),
+            ("test%value", "'%'.*are not supported"),
+            ("test;value", "';'.*are not supported"),
+            ("test value", "contains spaces"),
+        ],
+    )
+    def test_comprehensive_parameter_validation(self, client, invalid_value, pattern):
         """Test comprehensive parameter validation scenarios."""
-        # Test various invalid character combinations
-        invalid_values = [
-            ("test+value", "+"),
-            ("test&value", "&"),
-            ("test%value", "%"),
-            ("test;value", ";"),
-            ("test value", "space"),
-        ]
+        with pytest.raises(CyberarkCCPValidationError, match=pattern):
+            client._validate_url_value(invalid_value, "TestParam")
 
-        for invalid_value, expected_char in invalid_values:
-            with pytest.raises(CyberarkCCPValidationError) as exc_info:
-                self.client._validate_url_value(invalid_value, "TestParam")
-
-            error_message = str(exc_info.value)
-            if expected_char == "space":
-                assert "contains spaces" in error_message
-            else:
-                # Check that the specific character is mentioned in the error
-                assert expected_char in error_message
-                assert "are not supported" in error_message
-
-    def test_parameter_combination_validation(self):
-        """Test validation of parameter combinations."""
-        # Valid combinations that should work
-        valid_combinations = [
+    # Valid combinations that should work
+    @pytest.mark.parametrize(
+        "combination",
+        [
             {"safe": "ValidSafe"},
-            {"folder": "ValidFolder"},
             {"password_object": "ValidObject"},
             {"username": "ValidUser"},
             {"address": "valid.example.com"},
@@ -376,28 +343,24 @@ class TestParameterValidationIntegration:
             {"query": "Safe=ValidSafe"},
             {"safe": "ValidSafe", "username": "ValidUser"},
             {"query": "Safe=ValidSafe", "query_format": QueryFormat.REGEXP},
-        ]
+        ],
+    )
+    def test_parameter_combination_validation(self, mock_get, client, combination):
+        """Test get_account validates and sends each accepted parameter combination."""
+        mock_get.return_value = FakeResponse.from_json({"Content": "valid-password"})
+
+        account_info = client.get_account(**combination)
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args[1]["params"]["AppID"] == "TestApp"
+        assert account_info["Content"] == "valid-password"
 
-        for combination in valid_combinations:
-            try:
-                params = self.client._build_params(**combination)
-                assert "AppID" in params
-                assert params["AppID"] == "TestApp"
-            except CyberarkCCPValidationError as e:
-                if "AppID and at least one other parameter" not in str(e):
-                    pytest.fail(f"Valid combination {combination} failed validation: {e}")
-
-    @patch("cyberark_ccp.client.requests.Session.get")
-    def test_end_to_end_parameter_flow(self, mock_get):
+    def test_end_to_end_parameter_flow(self, mock_get, client):
         """Test end-to-end parameter validation and request flow."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"Content": "test-password"}
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = FakeResponse(content=b'{"Content": "test-password"}')
 
         # Test complex parameter combination
-        password = self.client.get_password(
+        password = client.get_password(
             safe="ProductionSafe",
             folder="DatabaseAccounts",
             password_object="MainDB_ServiceUser",
@@ -428,7 +391,8 @@ class TestParameterValidationIntegration:
             "FailRequestOnPasswordChange": "true",
         }
 
-        for key, value in expected_params.items():
-            assert params[key] == value
+        assert (
+            expected_params.items() <= params.items()
+        ), f"Missing/wrong params: {expected_params.items() - params.items()}"
 
         assert password == "test-password"